@@ -14,9 +14,11 @@ The rotation_version allows:
 - Auditing when legality decisions were made
 """
 
-from dataclasses import dataclass
+import bisect
+from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 
@@ -31,14 +33,51 @@ class LegalityFormat(str, Enum):
     TIMELESS = "timeless"
 
 
+class _RotationIndex:
+    """
+    Rotation versions kept in effective-date order.
+
+    Parallel sorted lists make date -> version lookups a binary search, and
+    adding a version is a single ordered insert rather than a full re-sort.
+    """
+
+    __slots__ = ("_dates", "_versions", "by_version")
+
+    def __init__(self, versions: dict[str, date]) -> None:
+        self._dates: list[date] = []
+        self._versions: list[str] = []
+        self.by_version: dict[str, date] = {}
+        for version, effective in versions.items():
+            self.add(version, effective)
+
+    def add(self, version: str, effective: date) -> None:
+        """Register a rotation version, keeping date order."""
+        if version in self.by_version:
+            raise ValueError(f"Rotation version '{version}' already registered")
+        index = bisect.bisect_right(self._dates, effective)
+        self._dates.insert(index, effective)
+        self._versions.insert(index, version)
+        self.by_version[version] = effective
+
+    def at_date(self, effective: date) -> str | None:
+        """Most recent version in effect on the given date, if any."""
+        index = bisect.bisect_right(self._dates, effective) - 1
+        return self._versions[index] if index >= 0 else None
+
+
 # Standard rotation versions (Q4 = rotation happens)
 # These represent the Standard pool AFTER the rotation
-ROTATION_VERSIONS = {
-    "2024-Q3": date(2024, 7, 1),  # Pre-rotation 2024
-    "2024-Q4": date(2024, 10, 1),  # Post-rotation 2024 (Bloomburrow onwards)
-    "2025-Q1": date(2025, 1, 1),  # Current
-    "2025-Q4": date(2025, 10, 1),  # Future rotation
-}
+_ROTATION_INDEX = _RotationIndex(
+    {
+        "2024-Q3": date(2024, 7, 1),  # Pre-rotation 2024
+        "2024-Q4": date(2024, 10, 1),  # Post-rotation 2024 (Bloomburrow onwards)
+        "2025-Q1": date(2025, 1, 1),  # Current
+        "2025-Q4": date(2025, 10, 1),  # Future rotation
+    }
+)
+
+# Read-only version -> effective date view of the index
+ROTATION_VERSIONS = MappingProxyType(_ROTATION_INDEX.by_version)
 
 # Current rotation version (update when rotation happens)
 CURRENT_ROTATION_VERSION = "2025-Q1"
@@ -56,19 +95,28 @@ class LegalityContext:
         format: The Arena format to check legality for
         rotation_version: Version identifier for rotation state
         effective_date: Optional specific date for legality check
+        format_name: Format name as a plain string for legality dict lookup
+            (derived from format; cached so hot paths skip the enum descriptor)
     """
 
     format: LegalityFormat
     rotation_version: str = CURRENT_ROTATION_VERSION
     effective_date: date | None = None
+    format_name: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate rotation version."""
+        """Cache format name and validate rotation version."""
+        object.__setattr__(self, "format_name", self.format.value)
+
         if self.rotation_version not in ROTATION_VERSIONS:
             # Allow unknown versions for forward compatibility
             # but warn in logs (not enforced here)
             pass
 
+    def __hash__(self) -> int:
+        """Hash of the compared fields (format_name stands in for format)."""
+        return hash((self.format_name, self.rotation_version, self.effective_date))
+
     @classmethod
     def current(cls, format: LegalityFormat) -> "LegalityContext":
         """
@@ -100,11 +148,7 @@ class LegalityContext:
         Determines rotation_version from the date.
         """
         # Find the most recent rotation version for this date
-        version = CURRENT_ROTATION_VERSION
-        for v, d in sorted(ROTATION_VERSIONS.items(), key=lambda x: x[1], reverse=True):
-            if effective_date >= d:
-                version = v
-                break
+        version = _ROTATION_INDEX.at_date(effective_date) or CURRENT_ROTATION_VERSION
 
         return cls(
             format=format,
@@ -112,11 +156,6 @@ class LegalityContext:
             effective_date=effective_date,
         )
 
-    @property
-    def format_name(self) -> str:
-        """Get format name as string for legality dict lookup."""
-        return self.format.value
-
 
 @dataclass(frozen=True, slots=True)
 class LegalityResult:
@@ -17,6 +17,9 @@ from forgebreaker.models.canonical_card import CanonicalCard, OwnedCard
 # Default max copies per card in constructed formats
 DEFAULT_MAX_COPIES = 4
 
+# Overlay chains deeper than this are collapsed to bound get_count() cost
+MAX_OVERLAY_DEPTH = 16
+
 
 class CopyLimitExceededError(Exception):
     """Raised when a deck would exceed copy limits."""
@@ -31,6 +34,24 @@ class CopyLimitExceededError(Exception):
         )
 
 
+def _copy_limit_error(
+    card_name: str, requested: int, owned: int, max_copies: int
+) -> CopyLimitExceededError:
+    """Classify a copy-limit violation (kept off the per-card happy path)."""
+    if owned == 0:
+        reason = "not owned"
+    elif owned < max_copies:
+        reason = f"only {owned} owned"
+    else:
+        reason = f"max {max_copies} per deck"
+    return CopyLimitExceededError(
+        card_name=card_name,
+        requested=requested,
+        available=min(owned, max_copies),
+        reason=reason,
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class OwnedCardPool:
     """
@@ -53,16 +74,72 @@ class OwnedCardPool:
         - Membership testing
         - Subset extraction for deck construction
         - Copy limit enforcement
+
+    Pools returned by consume_copies() are overlays: _cards holds only the
+    consumed cards' new counts (0 = fully consumed) and unchanged cards are
+    read through _parent. This keeps consume_copies() O(deck size) instead
+    of O(pool size). Chains are collapsed once they reach MAX_OVERLAY_DEPTH.
+    The resolved view is built on first whole-pool read and kept, so
+    repeated len()/items()/to_dict() calls do not re-walk the chain.
     """
 
     _cards: dict[str, int] = field(default_factory=dict)
+    _parent: "OwnedCardPool | None" = field(default=None, repr=False, compare=False)
+    _depth: int = field(default=0, repr=False, compare=False)
+    _flat: dict[str, int] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate all counts are positive."""
+        """Validate all counts are positive (overlays may record 0 = consumed)."""
+        min_count = 1 if self._parent is None else 0
         for name, count in self._cards.items():
-            if count <= 0:
+            if count < min_count:
                 raise ValueError(f"Card '{name}' has invalid count {count} (must be > 0)")
 
+    def __eq__(self, other: object) -> bool:
+        """Pools are equal when their resolved card counts are equal."""
+        if not isinstance(other, OwnedCardPool):
+            return NotImplemented
+        return self._flat_cards() == other._flat_cards()
+
+    def __repr__(self) -> str:
+        """Show the resolved counts, not just an overlay's own entries."""
+        return f"OwnedCardPool(_cards={self._flat_cards()!r})"
+
+    def _flat_cards(self) -> dict[str, int]:
+        """
+        Resolve the overlay chain into a single name -> count dict.
+
+        The result is cached on the pool; callers must not mutate it.
+        Root pools return their own dict.
+        """
+        if self._parent is None:
+            return self._cards
+        if self._flat is not None:
+            return self._flat
+
+        # Start from the nearest ancestor that is a root or already resolved
+        chain: list[OwnedCardPool] = []
+        pool = self
+        while pool._parent is not None and pool._flat is None:
+            chain.append(pool)
+            pool = pool._parent
+
+        cards = dict(pool._flat_cards())
+        for overlay in reversed(chain):
+            for name, count in overlay._cards.items():
+                if count > 0:
+                    cards[name] = count
+                else:
+                    cards.pop(name, None)
+        object.__setattr__(self, "_flat", cards)
+        return cards
+
+    def materialize(self) -> "OwnedCardPool":
+        """Collapse an overlay chain into a standalone pool."""
+        if self._parent is None:
+            return self
+        return OwnedCardPool(_cards=self._flat_cards())
+
     @classmethod
     def from_owned_cards(cls, owned_cards: list[OwnedCard]) -> "OwnedCardPool":
         """
@@ -90,19 +167,19 @@ class OwnedCardPool:
 
     def __contains__(self, card_name: str) -> bool:
         """Check if card is in pool (with count > 0)."""
-        return card_name in self._cards
+        return self.get_count(card_name) > 0
 
     def __len__(self) -> int:
         """Number of unique cards in pool."""
-        return len(self._cards)
+        return len(self._flat_cards())
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over card names."""
-        return iter(self._cards)
+        return iter(self._flat_cards())
 
     def items(self) -> Iterator[tuple[str, int]]:
         """Iterate over (name, count) pairs."""
-        return iter(self._cards.items())
+        return iter(self._flat_cards().items())
 
     def get_count(self, card_name: str) -> int:
         """
@@ -110,7 +187,13 @@ class OwnedCardPool:
 
         Returns 0 if card not in pool (never owned or count was 0).
         """
-        return self._cards.get(card_name, 0)
+        pool: OwnedCardPool | None = self
+        while pool is not None:
+            count = pool._cards.get(card_name)
+            if count is not None:
+                return count
+            pool = pool._parent
+        return 0
 
     def available_copies(
         self,
@@ -130,7 +213,7 @@ class OwnedCardPool:
         Returns:
             Number of copies available (0 if not owned)
         """
-        owned = self._cards.get(card.name, 0)
+        owned = self.get_count(card.name)
         return min(owned, max_copies)
 
     def get_max_copies(self, card_name: str, limit: int = DEFAULT_MAX_COPIES) -> int:
@@ -144,7 +227,7 @@ class OwnedCardPool:
         Returns:
             min(owned_count, limit), or 0 if not owned
         """
-        return min(self._cards.get(card_name, 0), limit)
+        return min(self.get_count(card_name), limit)
 
     def validate_deck(
         self,
@@ -165,23 +248,41 @@ class OwnedCardPool:
         Raises:
             CopyLimitExceededError: If any card exceeds limits
         """
+        violation = self._first_violation(deck, max_copies)
+        if violation is not None:
+            card_name, requested, owned = violation
+            raise _copy_limit_error(card_name, requested, owned, max_copies)
+
+    def _first_violation(
+        self,
+        deck: dict[str, int],
+        max_copies: int,
+    ) -> tuple[str, int, int] | None:
+        """Return (card_name, requested, owned) for the first card over its limit."""
         for card_name, requested in deck.items():
-            owned = self._cards.get(card_name, 0)
-            limit = min(owned, max_copies)
-
-            if requested > limit:
-                if owned == 0:
-                    reason = "not owned"
-                elif owned < max_copies:
-                    reason = f"only {owned} owned"
-                else:
-                    reason = f"max {max_copies} per deck"
-                raise CopyLimitExceededError(
-                    card_name=card_name,
-                    requested=requested,
-                    available=limit,
-                    reason=reason,
-                )
+            owned = self.get_count(card_name)
+            if requested > owned or requested > max_copies:
+                return card_name, requested, owned
+        return None
+
+    def _validate_and_consume(
+        self,
+        deck: dict[str, int],
+        max_copies: int,
+    ) -> dict[str, int]:
+        """
+        Validate a deck and compute remaining counts with one lookup per card.
+
+        Raises:
+            CopyLimitExceededError: If any card exceeds limits
+        """
+        remaining: dict[str, int] = {}
+        for card_name, requested in deck.items():
+            owned = self.get_count(card_name)
+            if requested > owned or requested > max_copies:
+                raise _copy_limit_error(card_name, requested, owned, max_copies)
+            remaining[card_name] = owned - requested
+        return remaining
 
     def consume_copies(
         self,
@@ -193,6 +294,9 @@ class OwnedCardPool:
 
         INVARIANT: Validates deck before consuming.
 
+        The returned pool is an overlay on this one: only the deck's cards
+        are copied, so the cost is proportional to the deck, not the pool.
+
         Args:
             deck: Card name -> count mapping for the deck
             max_copies: Maximum copies allowed per card (default 4)
@@ -203,24 +307,21 @@ class OwnedCardPool:
         Raises:
             CopyLimitExceededError: If any card exceeds limits
         """
-        # Validate first
-        self.validate_deck(deck, max_copies)
-
-        # Create new pool with consumed copies
-        remaining = dict(self._cards)
-        for card_name, consumed in deck.items():
-            remaining[card_name] = remaining.get(card_name, 0) - consumed
+        # Record only the consumed cards; everything else reads through self
+        overlay = self._validate_and_consume(deck, max_copies)
+        child = OwnedCardPool(_cards=overlay, _parent=self, _depth=self._depth + 1)
 
-        # Filter out zero counts
-        return OwnedCardPool.from_dict(remaining)
+        if child._depth >= MAX_OVERLAY_DEPTH:
+            return child.materialize()
+        return child
 
     def total_cards(self) -> int:
         """Total cards across all copies."""
-        return sum(self._cards.values())
+        return sum(self._flat_cards().values())
 
     def unique_cards(self) -> int:
         """Number of unique cards (same as __len__)."""
-        return len(self._cards)
+        return len(self._flat_cards())
 
     def filter_by_names(self, allowed_names: set[str]) -> "OwnedCardPool":
         """
@@ -228,12 +329,14 @@ class OwnedCardPool:
 
         Preserves counts for matching cards.
         """
-        filtered = {name: count for name, count in self._cards.items() if name in allowed_names}
+        filtered = {
+            name: count for name, count in self._flat_cards().items() if name in allowed_names
+        }
         return OwnedCardPool(_cards=filtered)
 
     def to_dict(self) -> dict[str, int]:
         """Export as dict (for compatibility with existing code)."""
-        return dict(self._cards)
+        return dict(self._flat_cards())
 
 
 def build_owned_pool(
@@ -23,7 +23,11 @@ class StressType(str, Enum):
     HOSTILE_META = "hostile_meta"  # Opponent has more interaction
 
 
-@dataclass
+# Intensities at or below this apply no stress at all
+NOOP_INTENSITY = 1e-9
+
+
+@dataclass(slots=True)
 class StressScenario:
     """
     A hypothetical scenario to explore with a deck.
@@ -40,15 +44,20 @@ class StressScenario:
 
     stress_type: StressType
     target: str
-    intensity: float = 0.5  # 0.0 = minimal, 1.0 = maximum stress
+    intensity: float = 0.5  # 0.0 = no stress, 1.0 = maximum stress
     description: str = ""
 
     def __post_init__(self) -> None:
         """Validate intensity is in range."""
         self.intensity = max(0.0, min(1.0, self.intensity))
 
+    @property
+    def is_noop(self) -> bool:
+        """Whether intensity is zero (checked against the current value)."""
+        return self.intensity <= NOOP_INTENSITY
+
 
-@dataclass
+@dataclass(slots=True)
 class StressedAssumption:
     """
     How a player belief changes under a hypothetical scenario.
@@ -74,7 +83,7 @@ class StressedAssumption:
     violation_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StressResult:
     """
     Result of exploring a stress scenario with a deck.
@@ -131,7 +140,7 @@ class StressResult:
         return self.assumption_violated or any(a.belief_violated for a in self.affected_assumptions)
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakingPointAnalysis:
     """
     Analysis of which belief fails first under stress.
@@ -6,8 +6,8 @@ All theme matching must go through ThemeIntent normalization first.
 """
 
 import logging
-import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -75,25 +75,19 @@ KNOWN_TRIBES: frozenset[str] = frozenset(
     }
 )
 
-# Words to strip from theme strings (noise words)
-NOISE_WORDS: frozenset[str] = frozenset(
-    {
-        "tribal",
-        "deck",
-        "build",
-        "me",
-        "a",
-        "the",
-        "with",
-        "around",
-        "themed",
-        "theme",
-        "based",
-        "type",
-        "creature",
-        "creatures",
-    }
-)
+# Every accepted token form -> (canonical tribe, match method).
+# Built once so normalize_theme does one dict lookup per token instead of
+# testing the token and a derived singular against KNOWN_TRIBES separately.
+_TRIBE_FORMS: dict[str, tuple[str, str]] = {
+    **{tribe + "s": (tribe, "singular_match") for tribe in KNOWN_TRIBES},
+    **{tribe: (tribe, "exact_match") for tribe in KNOWN_TRIBES},
+}
+
+# Theme separators besides whitespace, mapped to spaces before str.split()
+_THEME_SEPARATORS = str.maketrans(",;:", "   ")
+
+# Card name delimiters besides whitespace, mapped to spaces before str.split()
+_NAME_DELIMITERS = str.maketrans(",-'", "   ")
 
 
 @dataclass(frozen=True, slots=True)
@@ -122,6 +116,20 @@ class ThemeIntent:
         return f"ThemeIntent(raw={self.raw_theme})"
 
 
+def _log_normalized(raw_theme: str, tribe: str | None, method: str) -> None:
+    """Log a normalization result, skipping the extra dict when INFO is off."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(
+        "THEME_NORMALIZED",
+        extra={
+            "raw_theme": raw_theme,
+            "extracted_tribe": tribe,
+            "method": method,
+        },
+    )
+
+
 def normalize_theme(raw_theme: str) -> ThemeIntent:
     """
     Normalize a raw theme string into structured ThemeIntent.
@@ -146,52 +154,49 @@ def normalize_theme(raw_theme: str) -> ThemeIntent:
     if not raw_theme:
         return ThemeIntent(tribe=None, raw_theme=raw_theme)
 
-    # Lowercase and tokenize
-    theme_lower = raw_theme.lower().strip()
-    tokens = re.split(r"[\s,;:]+", theme_lower)
-
-    # Remove noise words
-    meaningful_tokens = [t for t in tokens if t and t not in NOISE_WORDS]
-
-    # Look for known tribes in tokens
-    for token in meaningful_tokens:
-        # Handle plurals (simple -s suffix)
-        singular = token.rstrip("s") if token.endswith("s") and len(token) > 2 else token
-
-        if token in KNOWN_TRIBES:
-            logger.info(
-                "THEME_NORMALIZED",
-                extra={
-                    "raw_theme": raw_theme,
-                    "extracted_tribe": token,
-                    "method": "exact_match",
-                },
-            )
-            return ThemeIntent(tribe=token, raw_theme=raw_theme)
-
-        if singular in KNOWN_TRIBES:
-            logger.info(
-                "THEME_NORMALIZED",
-                extra={
-                    "raw_theme": raw_theme,
-                    "extracted_tribe": singular,
-                    "method": "singular_match",
-                },
-            )
-            return ThemeIntent(tribe=singular, raw_theme=raw_theme)
+    # Fast path: most themes are a bare tribe word ("goblins"), which is
+    # itself a form key. Multi-word themes never are, so a miss falls through.
+    form = _TRIBE_FORMS.get(raw_theme.strip().lower())
+
+    if form is None:
+        # Lowercase and tokenize on whitespace and , ; :
+        tokens = raw_theme.lower().translate(_THEME_SEPARATORS).split()
+
+        # Look for known tribes in tokens (singular or simple -s plural).
+        # Noise words ("tribal", "deck", ...) are never tribe forms, so they
+        # simply miss the lookup.
+        for token in tokens:
+            form = _TRIBE_FORMS.get(token)
+            if form is not None:
+                break
+
+    if form is not None:
+        tribe, method = form
+        _log_normalized(raw_theme, tribe, method)
+        return ThemeIntent(tribe=tribe, raw_theme=raw_theme)
 
     # No tribe found - return with raw theme for fallback matching
-    logger.info(
-        "THEME_NORMALIZED",
-        extra={
-            "raw_theme": raw_theme,
-            "extracted_tribe": None,
-            "method": "no_tribe_found",
-        },
-    )
+    _log_normalized(raw_theme, None, "no_tribe_found")
     return ThemeIntent(tribe=None, raw_theme=raw_theme)
 
 
+@lru_cache(maxsize=4096)
+def _type_line_subtypes(type_line: str) -> frozenset[str]:
+    """
+    Lowercased subtypes from a type line (between the first and any second dash).
+
+    Cached because the same type lines ("Creature — Goblin", ...) recur
+    across thousands of cards and every tribe query re-reads them.
+    """
+    type_line = type_line.lower()
+    # Some cards use regular hyphen instead of the em dash
+    dash = "—" if "—" in type_line else "-"
+    _, found, after_dash = type_line.partition(dash)
+    if not found:
+        return frozenset()
+    return frozenset(after_dash.partition(dash)[0].split())
+
+
 def card_matches_tribe(
     card_name: str,
     card_data: dict[str, Any],
@@ -217,22 +222,8 @@ def card_matches_tribe(
     tribe_lower = tribe.lower()
 
     # Primary: Check type line for creature subtype
-    type_line = card_data.get("type_line", "").lower()
-
-    # Parse subtypes from type line (after the "—" or "-")
-    if "—" in type_line:
-        subtypes_part = type_line.split("—")[1].strip()
-        subtypes = subtypes_part.split()
-        if tribe_lower in subtypes:
-            return True
-    elif "-" in type_line:
-        # Some cards use regular hyphen
-        subtypes_part = type_line.split("-")[1].strip()
-        subtypes = subtypes_part.split()
-        if tribe_lower in subtypes:
-            return True
+    if tribe_lower in _type_line_subtypes(card_data.get("type_line", "")):
+        return True
 
     # Secondary: Check if tribe appears in card name as a token
-    name_lower = card_name.lower()
-    name_tokens = re.split(r"[\s,\-']+", name_lower)
-    return tribe_lower in name_tokens
+    return tribe_lower in card_name.lower().translate(_NAME_DELIMITERS).split()
@@ -13,7 +13,9 @@ is present in a ValidatedDeck object.
 This is enforced by code, not by convention.
 """
 
+import sys
 from dataclasses import dataclass, field
+from itertools import chain
 
 
 @dataclass(frozen=True)
@@ -103,13 +105,21 @@ def create_validated_deck(
     """
     sideboard = sideboard or {}
 
-    # Collect all unique card names
-    all_cards = frozenset(maindeck.keys()) | frozenset(sideboard.keys())
+    # Intern names so the card set and entry tuples share one string per card
+    main_entries = [(sys.intern(card), qty) for card, qty in maindeck.items()]
+    side_entries = [(sys.intern(card), qty) for card, qty in sideboard.items()]
+
+    # Collect all unique card names (one frozenset, no temporary sets to union)
+    all_cards = frozenset(card for card, _ in chain(main_entries, side_entries))
+
+    # Sort by card name for deterministic output
+    main_entries.sort()
+    side_entries.sort()
 
     return ValidatedDeck(
         cards=all_cards,
-        maindeck=tuple(sorted(maindeck.items())),
-        sideboard=tuple(sorted(sideboard.items())),
+        maindeck=tuple(main_entries),
+        sideboard=tuple(side_entries),
         name=name,
         format=format_name,
         validation_source=validation_source,
@@ -11,23 +11,76 @@ Example:
 Sections are separated by headers: Deck, Sideboard, Commander, Companion
 """
 
-import re
+from collections.abc import Iterator
 
 from forgebreaker.models.canonical_card import InventoryCard
 from forgebreaker.models.card import Card
 from forgebreaker.models.collection import Collection
+from forgebreaker.parsers.counts import keep_max
 
-# Pattern: "4 Lightning Bolt (LEB) 163" or "4 Card (SET) 290a"
-# Groups: (quantity, card_name, set_code, collector_number)
-# Collector number uses \S+ to match alphanumeric variants (e.g., "290a", "123s")
-ARENA_FULL_PATTERN = re.compile(r"^(\d+)\s+(.+?)\s+\(([A-Z0-9]+)\)\s+(\S+)$")
+# Arena lines are parsed with plain string splits rather than a regex:
+#   "4 Lightning Bolt (LEB) 163" -> (4, "Lightning Bolt", "LEB", "163")
+#   "4 Lightning Bolt"           -> (4, "Lightning Bolt", None, None)
+# Set codes are uppercase ASCII letters/digits; collector numbers are the
+# final whitespace-free token (e.g., "290a", "123s").
 
-# Pattern: "4 Lightning Bolt" (no set info)
-# Groups: (quantity, card_name)
-ARENA_SIMPLE_PATTERN = re.compile(r"^(\d+)\s+(.+)$")
 
-# Section headers in Arena exports
-SECTION_HEADERS = frozenset({"deck", "sideboard", "commander", "companion"})
+def _is_set_code(code: str) -> bool:
+    """Check for a non-empty uppercase ASCII alphanumeric set code."""
+    return code.isascii() and code.isalnum() and code.upper() == code
+
+
+def _parse_arena_line(line: str) -> tuple[int, str, str | None, str | None] | None:
+    """
+    Split one stripped line into (quantity, name, set_code, collector_number).
+
+    Returns None for lines without a leading quantity and a name, which
+    includes section headers (Deck, Sideboard, Commander, Companion).
+    """
+    parts = line.split(None, 1)
+    if len(parts) != 2 or not parts[0].isdecimal():
+        return None
+    quantity_str, rest = parts
+
+    # Full format: "<name> (<SET>) <collector>" - the set is the last
+    # parenthesized token before the collector number
+    head_and_collector = rest.rsplit(None, 1)
+    if len(head_and_collector) == 2:
+        head, collector_num = head_and_collector
+        if head.endswith(")"):
+            name_part, paren, set_part = head.rpartition("(")
+            set_code = set_part[:-1]
+            name = name_part.rstrip()
+            if paren and name and name_part[-1].isspace() and _is_set_code(set_code):
+                return int(quantity_str), name, set_code, collector_num
+
+    return int(quantity_str), rest, None, None
+
+
+def _iter_arena_lines(text: str) -> Iterator[tuple[int, str, str | None, str | None]]:
+    """
+    Yield (quantity, name, set_code, collector_number) for each card line.
+
+    set_code and collector_number are None for simple-format lines.
+    Empty lines, section headers and unmatched lines are skipped.
+    """
+    # split("\n") rather than splitlines(): the latter also breaks on
+    # \x0b, \x85, \u2028 and friends, which would split a card name in two.
+    # strip() drops the \r of CRLF exports.
+    for line in text.split("\n"):
+        line = line.strip()
+
+        # Skip empty lines
+        if not line:
+            continue
+
+        parsed = _parse_arena_line(line)
+        if parsed is None:
+            # Line didn't match any pattern - skip silently
+            # This handles comments or malformed lines gracefully
+            continue
+
+        yield parsed
 
 
 def parse_arena_export(text: str) -> list[Card]:
@@ -50,49 +103,15 @@ def parse_arena_export(text: str) -> list[Card]:
     if not text or not text.strip():
         return []
 
-    cards: list[Card] = []
-
-    for line in text.strip().split("\n"):
-        line = line.strip()
-
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Skip section headers
-        if line.lower() in SECTION_HEADERS:
-            continue
-
-        # Try full pattern first (with set code)
-        match = ARENA_FULL_PATTERN.match(line)
-        if match:
-            quantity, name, set_code, collector_num = match.groups()
-            cards.append(
-                Card(
-                    name=name,
-                    quantity=int(quantity),
-                    set_code=set_code,
-                    collector_number=collector_num,
-                )
-            )
-            continue
-
-        # Try simple pattern (no set code)
-        match = ARENA_SIMPLE_PATTERN.match(line)
-        if match:
-            quantity, name = match.groups()
-            cards.append(
-                Card(
-                    name=name,
-                    quantity=int(quantity),
-                )
-            )
-            continue
-
-        # Line didn't match any pattern - skip silently
-        # This handles comments or malformed lines gracefully
-
-    return cards
+    return [
+        Card(
+            name=name,
+            quantity=quantity,
+            set_code=set_code,
+            collector_number=collector_num,
+        )
+        for quantity, name, set_code, collector_num in _iter_arena_lines(text)
+    ]
 
 
 def parse_arena_to_inventory(text: str) -> list[InventoryCard]:
@@ -111,50 +130,15 @@ def parse_arena_to_inventory(text: str) -> list[InventoryCard]:
     if not text or not text.strip():
         return []
 
-    inventory: list[InventoryCard] = []
-
-    for line in text.strip().split("\n"):
-        line = line.strip()
-
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Skip section headers
-        if line.lower() in SECTION_HEADERS:
-            continue
-
-        # Try full pattern first (with set code)
-        match = ARENA_FULL_PATTERN.match(line)
-        if match:
-            quantity, name, set_code, collector_num = match.groups()
-            inventory.append(
-                InventoryCard(
-                    name=name,
-                    set_code=set_code,
-                    count=int(quantity),
-                    collector_number=collector_num,
-                )
-            )
-            continue
-
-        # Try simple pattern (no set code)
-        match = ARENA_SIMPLE_PATTERN.match(line)
-        if match:
-            quantity, name = match.groups()
-            inventory.append(
-                InventoryCard(
-                    name=name,
-                    set_code="",
-                    count=int(quantity),
-                    collector_number=None,
-                )
-            )
-            continue
-
-        # Line didn't match any pattern - skip silently
-
-    return inventory
+    return [
+        InventoryCard(
+            name=name,
+            set_code=set_code or "",
+            count=quantity,
+            collector_number=collector_num,
+        )
+        for quantity, name, set_code, collector_num in _iter_arena_lines(text)
+    ]
 
 
 def cards_to_collection(cards: list[Card]) -> Collection:
@@ -170,11 +154,11 @@ def cards_to_collection(cards: list[Card]) -> Collection:
         Collection with max quantities per card name
     """
     collection = Collection()
+    counts = collection.cards
 
     for card in cards:
         # Use max to handle same card from different sets (Arena exports each set separately)
-        current = collection.cards.get(card.name, 0)
-        collection.cards[card.name] = max(current, card.quantity)
+        keep_max(counts, card.name, card.quantity)
 
     return collection
 
@@ -188,6 +172,17 @@ def parse_arena_to_collection(text: str) -> Collection:
 
     Returns:
         Collection with all cards from export
+
+    Equivalent to cards_to_collection(parse_arena_export(text)), but folds
+    each line straight into the collection without building Card objects.
     """
-    cards = parse_arena_export(text)
-    return cards_to_collection(cards)
+    collection = Collection()
+    if not text or not text.strip():
+        return collection
+
+    counts = collection.cards
+    for quantity, name, _set_code, _collector_num in _iter_arena_lines(text):
+        # Use max to handle same card from different sets
+        keep_max(counts, name, quantity)
+
+    return collection
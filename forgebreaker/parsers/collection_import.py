@@ -13,10 +13,10 @@ from io import StringIO
 from typing import Literal
 
 from forgebreaker.models.collection import Collection
+from forgebreaker.parsers.counts import keep_max
 
-# Pattern: "4 Lightning Bolt" or "4x Lightning Bolt" or "4X Lightning Bolt"
-# Groups: (quantity, card_name)
-SIMPLE_PATTERN = re.compile(r"^(\d+)x?\s+(.+)$", re.IGNORECASE)
+# Pattern: "4 Card Name (SET) 123" - Arena format with set code, used for detection
+ARENA_DETECT_PATTERN = re.compile(r"^\d+\s+.+\s+\([A-Z0-9]+\)\s+\S+$")
 
 
 def parse_simple_format(text: str) -> dict[str, int]:
@@ -34,17 +34,20 @@ def parse_simple_format(text: str) -> dict[str, int]:
     cards: dict[str, int] = {}
 
     for line in text.strip().split("\n"):
-        line = line.strip()
-        if not line:
+        # "<quantity>[x|X] <name>" - split once instead of running a regex
+        parts = line.split(None, 1)
+        if len(parts) != 2:
             continue
 
-        match = SIMPLE_PATTERN.match(line)
-        if match:
-            quantity = int(match.group(1))
-            name = match.group(2).strip()
+        quantity_str, name = parts
+        if quantity_str[-1] in "xX":
+            quantity_str = quantity_str[:-1]
+        if quantity_str.isdecimal():
+            quantity = int(quantity_str)
+            name = name.strip()
             if name:
                 # Use max for duplicates (same card from different sets)
-                cards[name] = max(cards.get(name, 0), quantity)
+                keep_max(cards, name, quantity)
 
     return cards
 
@@ -100,7 +103,7 @@ def parse_csv_format(text: str) -> dict[str, int]:
 
         if quantity > 0:
             # Use max for duplicates (same card from different sets)
-            cards[name] = max(cards.get(name, 0), quantity)
+            keep_max(cards, name, quantity)
 
     return cards
 
@@ -127,13 +130,9 @@ def detect_format(text: str) -> Literal["simple", "csv", "arena"]:
         if any(h in lower_first for h in ("card name", "name", "quantity", "count")):
             return "csv"
 
-    # Check for Arena format: lines have set codes in parentheses
-    # Pattern: "4 Card Name (SET) 123"
-    arena_pattern = re.compile(r"^\d+\s+.+\s+\([A-Z0-9]+\)\s+\S+$")
-    for line in lines[:10]:  # Check first 10 lines
-        line = line.strip()
-        if line and arena_pattern.match(line):
-            return "arena"
+    # Check for Arena format: lines have set codes in parentheses (first 10 lines)
+    if any(ARENA_DETECT_PATTERN.match(line.strip()) for line in lines[:10]):
+        return "arena"
 
     return "simple"
 
@@ -180,7 +179,7 @@ def merge_collections(base: dict[str, int], new: dict[str, int]) -> dict[str, in
     """
     result = dict(base)
     for name, qty in new.items():
-        result[name] = max(result.get(name, 0), qty)
+        keep_max(result, name, qty)
     return result
 
 
@@ -203,10 +202,8 @@ def parse_multiple_decks(deck_texts: list[str]) -> Collection:
         if not text or not text.strip():
             continue
         deck_cards = parse_collection_text(text, "auto")
-        merged = merge_collections(merged, deck_cards)
+        # Fold in place rather than copying the running result per deck
+        for name, qty in deck_cards.items():
+            keep_max(merged, name, qty)
 
-    collection = Collection()
-    for name, qty in merged.items():
-        collection.add_card(name, qty)
-
-    return collection
+    return Collection(cards=merged)
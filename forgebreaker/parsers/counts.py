@@ -0,0 +1,18 @@
+"""
+Shared helpers for folding card counts while parsing.
+"""
+
+
+def keep_max(counts: dict[str, int], name: str, quantity: int) -> None:
+    """
+    Fold quantity into counts[name], keeping the maximum seen.
+
+    Missing names count as 0, so the stored value is never below 0 unless
+    counts already held a negative. A smaller quantity costs one lookup
+    and no store.
+    """
+    current = counts.get(name)
+    if current is None:
+        counts[name] = max(quantity, 0)
+    elif quantity > current:
+        counts[name] = quantity
@@ -7,9 +7,12 @@ for arena_id -> card_name mapping and card rarities.
 Bulk data: https://scryfall.com/docs/api/bulk-data
 """
 
+import io
 import json
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TextIO, TypedDict
 
 import httpx
 
@@ -17,6 +20,21 @@ SCRYFALL_BULK_API = "https://api.scryfall.com/bulk-data"
 
 VALID_RARITIES = frozenset({"common", "uncommon", "rare", "mythic"})
 
+# Bulk JSON is read in chunks of this many characters while streaming
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Characters JSON allows between tokens
+_JSON_WHITESPACE = frozenset(" \t\r\n")
+
+# Characters buffered for a single element before the stream is rejected,
+# so a corrupt file fails without reading the rest of it into memory
+_MAX_ELEMENT_SIZE = 1 << 24
+
+_DECODER = json.JSONDecoder()
+
+# Bump when the mappings sidecar layout changes to invalidate old sidecars
+_MAPPINGS_CACHE_VERSION = 1
+
 
 def _normalize_rarity(rarity: str) -> str:
     """Normalize rarity to one of: common, uncommon, rare, mythic."""
@@ -31,6 +49,188 @@ class CardData(TypedDict):
     rarity: str  # common, uncommon, rare, mythic
 
 
+# (arena_id -> name, name -> rarity, name -> CardData)
+ScryfallMappings = tuple[dict[int, str], dict[str, str], dict[str, CardData]]
+
+
+def _skip_whitespace(stream: TextIO, buffer: str, pos: int, chunk_size: int) -> tuple[str, int]:
+    """Advance past JSON whitespace, refilling the buffer; ("", 0) at end of stream."""
+    while True:
+        while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+            pos += 1
+        if pos < len(buffer):
+            return buffer, pos
+        buffer, pos = stream.read(chunk_size), 0
+        if not buffer:
+            return buffer, pos
+
+
+def iter_json_array(
+    stream: TextIO,
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+    max_element_size: int = _MAX_ELEMENT_SIZE,
+) -> Iterator[Any]:
+    """
+    Stream the elements of a top-level JSON array of objects.
+
+    Only the current chunk plus one partially-read element is held in
+    memory, so an ~80MB bulk file never materializes as one list.
+    Elements must be objects (or arrays) so a chunk boundary can never
+    cut one into a shorter valid value.
+
+    Args:
+        stream: Text stream positioned at the start of the array
+        chunk_size: Characters to read per chunk
+        max_element_size: Characters to buffer for one element before
+            giving up on it
+
+    Raises:
+        ValueError: If the stream is not a well-formed JSON array (as
+            json.load would judge it) or an element exceeds max_element_size
+    """
+    buffer, pos = _skip_whitespace(stream, stream.read(chunk_size), 0, chunk_size)
+    if not buffer.startswith("[", pos):
+        raise ValueError("Expected a JSON array")
+
+    buffer, pos = _skip_whitespace(stream, buffer, pos + 1, chunk_size)
+    if buffer.startswith("]", pos):
+        pos += 1
+    else:
+        while True:
+            if pos >= len(buffer):
+                raise ValueError("Unterminated JSON array")
+
+            try:
+                item, pos = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element may span the chunk boundary: keep the tail, read more
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    raise
+                if len(buffer) - pos > max_element_size:
+                    raise ValueError("JSON array element exceeds max_element_size") from None
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            yield item
+
+            # Exactly one "," between elements, or the closing "]"
+            buffer, pos = _skip_whitespace(stream, buffer, pos, chunk_size)
+            if pos >= len(buffer):
+                raise ValueError("Unterminated JSON array")
+            if buffer[pos] == "]":
+                pos += 1
+                break
+            if buffer[pos] != ",":
+                raise ValueError("Expected ',' or ']' between JSON array elements")
+
+            buffer, pos = _skip_whitespace(stream, buffer, pos + 1, chunk_size)
+            if buffer.startswith((",", "]"), pos):
+                raise ValueError("Expected a JSON array element after ','")
+
+    # Only whitespace may follow the array
+    buffer, pos = _skip_whitespace(stream, buffer, pos, chunk_size)
+    if pos < len(buffer):
+        raise ValueError("Extra data after JSON array")
+
+
+class _ByteChunkReader(io.RawIOBase):
+    """Read-only binary stream over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, b"")
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _mappings_cache_path(bulk_data_path: Path) -> Path:
+    """Sidecar file holding the parsed mappings for a bulk data file."""
+    return bulk_data_path.with_suffix(".mappings.json")
+
+
+def _bulk_signature(bulk_data_path: Path) -> list[int]:
+    """Modification time and size identifying one version of the bulk file."""
+    stat = bulk_data_path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_mappings_cache(bulk_data_path: Path) -> ScryfallMappings | None:
+    """
+    Return cached mappings if the sidecar was built from this bulk file.
+
+    The sidecar records the bulk file's mtime and size and must match both
+    exactly, so a replacement with an older preserved mtime (cp -p, rsync)
+    is still detected. It is plain JSON, so a tampered file can at worst
+    yield wrong mappings, never run code. Anything malformed falls back to
+    a re-parse.
+    """
+    cache_path = _mappings_cache_path(bulk_data_path)
+    try:
+        signature = _bulk_signature(bulk_data_path)
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt sidecar just means a re-parse
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _MAPPINGS_CACHE_VERSION
+        or payload.get("bulk") != signature
+    ):
+        return None
+
+    try:
+        arena_ids = {int(arena_id): sys.intern(name) for arena_id, name in payload["arena_ids"]}
+        data: dict[str, CardData] = {}
+        for card in payload["cards"]:
+            name = sys.intern(card["name"])
+            data[name] = CardData(name=name, arena_id=card["arena_id"], rarity=card["rarity"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    rarities = {name: card["rarity"] for name, card in data.items()}
+    return arena_ids, rarities, data
+
+
+def _write_mappings_cache(
+    bulk_data_path: Path, signature: list[int], mappings: ScryfallMappings
+) -> None:
+    """Write the mappings sidecar atomically; failures only cost a re-parse."""
+    arena_ids, _, data = mappings
+    cache_path = _mappings_cache_path(bulk_data_path)
+    temp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+    # Rarities are not stored: they always match the card data entries
+    payload = {
+        "version": _MAPPINGS_CACHE_VERSION,
+        "bulk": signature,
+        "arena_ids": list(arena_ids.items()),
+        "cards": list(data.values()),
+    }
+    try:
+        temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+
+
+def _iter_bulk_cards(bulk_data_path: Path) -> Iterator[dict[str, Any]]:
+    """Stream card objects from a Scryfall bulk JSON file."""
+    with open(bulk_data_path, encoding="utf-8") as f:
+        yield from iter_json_array(f)
+
+
 def get_bulk_data_url() -> str:
     """
     Fetch the download URL for Scryfall's default-cards bulk data.
@@ -61,6 +261,9 @@ def download_bulk_data(output_path: Path) -> None:
     """
     Download Scryfall bulk data to a file.
 
+    Use this to keep a local copy; stream_load_mappings builds the
+    mappings straight from the download without touching disk.
+
     Args:
         output_path: Where to save the JSON file
 
@@ -94,13 +297,10 @@ def load_arena_id_mapping(bulk_data_path: Path) -> dict[int, str]:
     """
     mapping: dict[int, str] = {}
 
-    with open(bulk_data_path, encoding="utf-8") as f:
-        cards = json.load(f)
-
-    for card in cards:
+    for card in _iter_bulk_cards(bulk_data_path):
         arena_id = card.get("arena_id")
         if arena_id is not None:
-            mapping[arena_id] = card["name"]
+            mapping[arena_id] = sys.intern(card["name"])
 
     return mapping
 
@@ -120,11 +320,8 @@ def load_rarity_mapping(bulk_data_path: Path) -> dict[str, str]:
     """
     mapping: dict[str, str] = {}
 
-    with open(bulk_data_path, encoding="utf-8") as f:
-        cards = json.load(f)
-
-    for card in cards:
-        name = card["name"]
+    for card in _iter_bulk_cards(bulk_data_path):
+        name = sys.intern(card["name"])
         rarity = _normalize_rarity(card.get("rarity", "common"))
 
         # Later entries overwrite earlier (more recent printings)
@@ -145,11 +342,8 @@ def load_card_data(bulk_data_path: Path) -> dict[str, CardData]:
     """
     data: dict[str, CardData] = {}
 
-    with open(bulk_data_path, encoding="utf-8") as f:
-        cards = json.load(f)
-
-    for card in cards:
-        name = card["name"]
+    for card in _iter_bulk_cards(bulk_data_path):
+        name = sys.intern(card["name"])
         data[name] = CardData(
             name=name,
             arena_id=card.get("arena_id"),
@@ -157,3 +351,86 @@ def load_card_data(bulk_data_path: Path) -> dict[str, CardData]:
         )
 
     return data
+
+
+def load_all_mappings(bulk_data_path: Path, use_cache: bool = False) -> ScryfallMappings:
+    """
+    Build the arena_id, rarity and card data mappings in one pass.
+
+    Equivalent to calling load_arena_id_mapping, load_rarity_mapping and
+    load_card_data, but the bulk file is read and parsed only once.
+
+    With use_cache, the result is also written to a JSON sidecar next to
+    the bulk file and reused until the bulk file's mtime or size changes.
+
+    Args:
+        bulk_data_path: Path to downloaded Scryfall bulk JSON
+        use_cache: Read and write the mappings sidecar (off by default, as
+            it writes a file next to the bulk data)
+
+    Returns:
+        Tuple of (arena_id -> name, name -> rarity, name -> CardData)
+    """
+    if use_cache:
+        cached = _read_mappings_cache(bulk_data_path)
+        if cached is not None:
+            return cached
+
+    # Taken before parsing, so a file changed mid-parse never looks fresh
+    signature = _bulk_signature(bulk_data_path)
+    mappings = _build_mappings(_iter_bulk_cards(bulk_data_path))
+
+    if use_cache:
+        _write_mappings_cache(bulk_data_path, signature, mappings)
+    return mappings
+
+
+def stream_load_mappings(url: str | None = None) -> ScryfallMappings:
+    """
+    Download Scryfall bulk data and build all mappings as it arrives.
+
+    Response chunks are decoded and parsed while the download is still in
+    progress, so nothing is written to disk and the file is never held in
+    memory whole.
+
+    Args:
+        url: Bulk data URL. Defaults to the current default-cards download.
+
+    Returns:
+        Same tuple as load_all_mappings
+
+    Raises:
+        httpx.HTTPError: If the download fails
+    """
+    if url is None:
+        url = get_bulk_data_url()
+
+    with httpx.stream(
+        "GET",
+        url,
+        headers={"User-Agent": "ForgeBreaker/1.0"},
+        follow_redirects=True,
+    ) as response:
+        response.raise_for_status()
+        raw = _ByteChunkReader(response.iter_bytes(chunk_size=65536))
+        with io.TextIOWrapper(io.BufferedReader(raw), encoding="utf-8") as text:
+            return _build_mappings(iter_json_array(text))
+
+
+def _build_mappings(cards: Iterable[dict[str, Any]]) -> ScryfallMappings:
+    """Fold card objects into (arena_id, rarity, card data) mappings."""
+    arena_ids: dict[int, str] = {}
+    rarities: dict[str, str] = {}
+    data: dict[str, CardData] = {}
+
+    for card in cards:
+        name = sys.intern(card["name"])
+        arena_id = card.get("arena_id")
+        rarity = _normalize_rarity(card.get("rarity", "common"))
+
+        if arena_id is not None:
+            arena_ids[arena_id] = name
+        rarities[name] = rarity
+        data[name] = CardData(name=name, arena_id=arena_id, rarity=rarity)
+
+    return arena_ids, rarities, data
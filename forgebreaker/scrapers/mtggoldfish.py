@@ -8,8 +8,12 @@ Note: Web scraping is inherently fragile. Page structure may change.
 Uses download endpoint for deck lists (text format) since JS rendering is required for HTML.
 """
 
+import asyncio
+import atexit
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 
 import httpx
 
@@ -21,6 +25,166 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 # Valid Arena formats on MTGGoldfish (excludes Brawl - singleton format with no sideboard)
 VALID_FORMATS = frozenset({"standard", "historic", "explorer", "timeless"})
 
+# Deck name keywords per archetype, checked in order (first match wins)
+_ARCHETYPE_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("aggro", ("aggro", "burn", "red deck", "sligh")),
+    ("control", ("control", "blue", "esper", "azorius")),
+    ("combo", ("combo", "storm", "ramp")),
+)
+
+# Max decks fetched at once by fetch_meta_decks_async
+MAX_CONCURRENT_FETCHES = 8
+
+# Pages kept by the shared default client's ResponseCache
+DEFAULT_RESPONSE_CACHE_SIZE = 32
+
+# Metagame page URL per valid format (doubles as the format check)
+_METAGAME_URLS = {fmt: f"{MTGGOLDFISH_BASE}/metagame/{fmt}" for fmt in VALID_FORMATS}
+
+# Deck links on the metagame page
+# Example: <a href="/archetype/mono-red-aggro#paper">Mono Red Aggro</a>
+DECK_LINK_PATTERN = re.compile(
+    r'href="(/archetype/[^"#]+)[^"]*"[^>]*>\s*'  # href with archetype URL
+    r"([^<]+?)\s*</a>"  # deck name
+)
+
+# Meta share percentage following a deck link, like "12.5%"
+META_SHARE_PATTERN = re.compile(r"(\d+\.?\d*)%")
+
+# Max characters of tile markup between a deck name and its meta share
+_MAX_SHARE_GAP = 2000
+
+# Deck IDs on archetype pages (e.g. /deck/7496197)
+DECK_ID_PATTERN = re.compile(r"/deck/(\d+)")
+
+
+@lru_cache(maxsize=1)
+def _default_client() -> httpx.Client:
+    """
+    Shared client used when callers don't pass one.
+
+    Keeps connections to MTGGoldfish alive across calls so repeated fetches
+    skip the TLS handshake. Closed at interpreter exit.
+    """
+    client = httpx.Client(headers={"User-Agent": USER_AGENT}, follow_redirects=True)
+    atexit.register(client.close)
+    return client
+
+
+class ResponseCache:
+    """
+    Bounded cache of pages served with an ETag/Last-Modified validator.
+
+    Cached pages are revalidated with a conditional GET, so unchanged pages
+    come back as an empty 304 instead of the full HTML. Pass one to the
+    fetch functions alongside a client to enable revalidation for it; the
+    oldest page is evicted once max_size is reached.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        # url -> (etag, last_modified, body); dicts keep insertion order
+        self._entries: dict[str, tuple[str | None, str | None, str]] = {}
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached page."""
+        self._entries.clear()
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Revalidation headers for a previously cached response, if any."""
+        cached = self._entries.get(url)
+        if cached is None:
+            return {}
+
+        etag, last_modified, _ = cached
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def body(self, url: str) -> str | None:
+        """Cached body for a URL, or None if it is not (or no longer) cached."""
+        cached = self._entries.get(url)
+        return cached[2] if cached is not None else None
+
+    def store(self, url: str, response: httpx.Response) -> str:
+        """
+        Return a full response body, caching it if it carries a validator.
+
+        Raises:
+            httpx.HTTPStatusError: If the request failed
+        """
+        response.raise_for_status()
+        text = response.text
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            if url not in self._entries and len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+            self._entries[url] = (etag, last_modified, text)
+
+        return text
+
+
+@lru_cache(maxsize=1)
+def _default_cache() -> ResponseCache:
+    """Response cache paired with the shared default client."""
+    return ResponseCache()
+
+
+def _get_text(url: str, client: httpx.Client, cache: ResponseCache | None) -> str:
+    """
+    GET a page, revalidating it against cache when one is given.
+
+    Raises:
+        httpx.HTTPStatusError: If the request failed
+    """
+    if cache is None:
+        response = client.get(url)
+        response.raise_for_status()
+        return response.text
+
+    response = client.get(url, headers=cache.conditional_headers(url))
+    if response.status_code == 304:
+        body = cache.body(url)
+        if body is not None:
+            return body
+        # Entry was evicted while the request was in flight: fetch in full
+        response = client.get(url)
+    return cache.store(url, response)
+
+
+async def _get_text_async(url: str, client: httpx.AsyncClient, cache: ResponseCache | None) -> str:
+    """Async counterpart of _get_text."""
+    if cache is None:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.text
+
+    response = await client.get(url, headers=cache.conditional_headers(url))
+    if response.status_code == 304:
+        body = cache.body(url)
+        if body is not None:
+            return body
+        # Entry was evicted while the request was in flight: fetch in full
+        response = await client.get(url)
+    return cache.store(url, response)
+
+
+def _resolve_client(
+    client: httpx.Client | None, cache: ResponseCache | None
+) -> tuple[httpx.Client, ResponseCache | None]:
+    """Fall back to the shared client, and its cache, when none is given."""
+    if client is None:
+        return _default_client(), cache if cache is not None else _default_cache()
+    return client, cache
+
 
 @dataclass
 class DeckSummary:
@@ -33,13 +197,19 @@ class DeckSummary:
     format: str
 
 
-def fetch_metagame_page(format_name: str, client: httpx.Client | None = None) -> str:
+def fetch_metagame_page(
+    format_name: str,
+    client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
+) -> str:
     """
     Fetch the metagame page HTML for a format.
 
     Args:
         format_name: Arena format (standard, historic, explorer, timeless)
         client: Optional httpx client for connection reuse
+        cache: Optional response cache. Defaults to the shared client's
+            cache when client is omitted, and to no caching otherwise.
 
     Returns:
         Raw HTML content
@@ -48,21 +218,47 @@ def fetch_metagame_page(format_name: str, client: httpx.Client | None = None) ->
         ValueError: If format is not valid
         httpx.HTTPError: If request fails
     """
-    if format_name not in VALID_FORMATS:
+    url = _METAGAME_URLS.get(format_name)
+    if url is None:
         raise ValueError(f"Invalid format: {format_name}. Must be one of {VALID_FORMATS}")
 
-    url = f"{MTGGOLDFISH_BASE}/metagame/{format_name}"
+    return _get_text(url, *_resolve_client(client, cache))
 
-    if client:
-        response = client.get(url)
-    else:
-        response = httpx.get(url, headers={"User-Agent": USER_AGENT}, follow_redirects=True)
 
-    response.raise_for_status()
-    return response.text
+def _ends_with_number(html: str, end: int) -> bool:
+    """Whether html[:end] ends in a META_SHARE_PATTERN number ("12", "12.5", "12.")."""
+    prev = html[end - 1]
+    if prev == ".":
+        prev = html[end - 2]
+    return prev.isdecimal()
+
 
+def _iter_deck_tiles(html: str) -> Iterator[tuple[str, str, str]]:
+    """
+    Yield (url_path, name, meta_pct) for each deck tile on a metagame page.
 
-def parse_metagame_page(html: str, format_name: str) -> list[DeckSummary]:
+    Each deck link is paired with the first "<number>%" that follows it, if
+    that starts within _MAX_SHARE_GAP characters. A "%" without a digit
+    before it (such as a URL-encoded "%2F") is skipped. Links without a
+    share nearby (nav menus, footers) are skipped. The share is searched
+    only inside that window, so no regex gap spans the page.
+    """
+    pos = 0
+    while (link := DECK_LINK_PATTERN.search(html, pos)) is not None:
+        window_end = link.end() + _MAX_SHARE_GAP + 32
+        pct_end = html.find("%", link.end(), window_end)
+        while pct_end >= 0 and not _ends_with_number(html, pct_end):
+            pct_end = html.find("%", pct_end + 1, window_end)
+        share = META_SHARE_PATTERN.search(html, link.end(), pct_end + 1) if pct_end >= 0 else None
+
+        if share is not None and share.start() - link.end() <= _MAX_SHARE_GAP:
+            yield link.group(1), link.group(2), share.group(1)
+            pos = share.end()
+        else:
+            pos = link.start() + 1
+
+
+def parse_metagame_page(html: str, format_name: str, limit: int | None = None) -> list[DeckSummary]:
     """
     Parse deck summaries from a metagame page.
 
@@ -72,65 +268,54 @@ def parse_metagame_page(html: str, format_name: str) -> list[DeckSummary]:
     Args:
         html: Raw HTML content from metagame page
         format_name: The format being parsed
+        limit: Stop scanning once this many unique decks are found
 
     Returns:
         List of DeckSummary objects
     """
     summaries: list[DeckSummary] = []
-    seen_names: set[str] = set()  # Avoid duplicates
-
-    # Pattern matches deck tiles with meta share percentage
-    # Example: <a href="/archetype/mono-red-aggro#paper">Mono Red Aggro</a>
-    # followed by meta percentage like "12.5%"
-    # Matches: href="/archetype/..." followed by deck name, then percentage
-    deck_pattern = re.compile(
-        r'href="(/archetype/[^"#]+)[^"]*"[^>]*>\s*'  # href with archetype URL
-        r"([^<]+?)\s*</a>"  # deck name
-        r".*?"  # anything between
-        r"(\d+\.?\d*)%",  # meta share percentage
-        re.DOTALL,
-    )
+    seen_paths: set[str] = set()  # Avoid duplicates
 
-    for match in deck_pattern.finditer(html):
-        url_path, name, meta_pct = match.groups()
-        name = name.strip()
+    if limit is not None and limit <= 0:
+        return summaries
 
-        # Skip duplicates (same archetype can appear multiple times)
-        if name in seen_names:
+    for url_path, name, meta_pct in _iter_deck_tiles(html):
+        # Skip duplicates (same archetype can appear multiple times).
+        # The archetype path identifies it even if the link text differs.
+        if url_path in seen_paths:
             continue
-        seen_names.add(name)
+        seen_paths.add(url_path)
 
         summaries.append(
             DeckSummary(
-                name=name,
+                name=name.strip(),
                 url=f"{MTGGOLDFISH_BASE}{url_path}",
                 deck_id=None,  # Will be fetched from archetype page
                 meta_share=float(meta_pct) / 100.0,
                 format=format_name,
             )
         )
+        if limit is not None and len(summaries) >= limit:
+            break
 
     return summaries
 
 
-def fetch_archetype_page(url: str, client: httpx.Client | None = None) -> str:
+def fetch_archetype_page(
+    url: str, client: httpx.Client | None = None, cache: ResponseCache | None = None
+) -> str:
     """
     Fetch an archetype page HTML.
 
     Args:
         url: Full URL to archetype page
         client: Optional httpx client for connection reuse
+        cache: Optional response cache (see fetch_metagame_page)
 
     Returns:
         Raw HTML content
     """
-    if client:
-        response = client.get(url)
-    else:
-        response = httpx.get(url, headers={"User-Agent": USER_AGENT}, follow_redirects=True)
-
-    response.raise_for_status()
-    return response.text
+    return _get_text(url, *_resolve_client(client, cache))
 
 
 def extract_deck_id_from_archetype(html: str) -> str | None:
@@ -143,32 +328,33 @@ def extract_deck_id_from_archetype(html: str) -> str | None:
     Returns:
         Deck ID string or None if not found
     """
-    # Pattern to find deck IDs (e.g. /deck/7496197)
-    deck_id_pattern = re.compile(r"/deck/(\d+)")
-    match = deck_id_pattern.search(html)
-    return match.group(1) if match else None
-
-
-def fetch_deck_download(deck_id: str, client: httpx.Client | None = None) -> str:
+    # Jump between "/deck/" occurrences with str.find and only run the
+    # anchored pattern there, instead of letting the regex walk the page
+    start = html.find("/deck/")
+    while start >= 0:
+        match = DECK_ID_PATTERN.match(html, start)
+        if match:
+            return match.group(1)
+        start = html.find("/deck/", start + 1)
+    return None
+
+
+def fetch_deck_download(
+    deck_id: str, client: httpx.Client | None = None, cache: ResponseCache | None = None
+) -> str:
     """
     Fetch deck in text format via download endpoint.
 
     Args:
         deck_id: The deck ID number
         client: Optional httpx client for connection reuse
+        cache: Optional response cache (see fetch_metagame_page)
 
     Returns:
         Plain text deck list (simple format: qty CardName, one per line)
     """
     url = f"{MTGGOLDFISH_BASE}/deck/download/{deck_id}"
-
-    if client:
-        response = client.get(url)
-    else:
-        response = httpx.get(url, headers={"User-Agent": USER_AGENT}, follow_redirects=True)
-
-    response.raise_for_status()
-    return response.text
+    return _get_text(url, *_resolve_client(client, cache))
 
 
 def parse_deck_download(text: str, summary: DeckSummary) -> MetaDeck:
@@ -193,26 +379,29 @@ def parse_deck_download(text: str, summary: DeckSummary) -> MetaDeck:
     cards: dict[str, int] = {}
     sideboard: dict[str, int] = {}
 
-    # Pattern: qty CardName (simple format)
-    # Matches: "4 Lightning Bolt" -> (4, Lightning Bolt)
-    card_pattern = re.compile(r"^(\d+)\s+(.+)$", re.MULTILINE)
-
-    # Split by blank lines to separate main deck from sideboard
-    sections = re.split(r"\n\s*\n", text.strip())
+    # Main deck is the first section; a blank line switches to the
+    # sideboard, and anything after a second blank line is ignored
+    section = cards
+    after_blank = False
+
+    # split("\n") rather than splitlines(), which also breaks on \x1c,
+    # \u2028 and friends and would cut a card line in two
+    for line in text.strip().split("\n"):
+        # "qty CardName" - split once instead of running a regex
+        parts = line.strip().split(None, 1)
+        if not parts:
+            after_blank = True
+            continue
 
-    # Main deck is first section
-    if sections:
-        for match in card_pattern.finditer(sections[0]):
-            qty, name = match.groups()
-            name = name.strip()
-            cards[name] = cards.get(name, 0) + int(qty)
+        if after_blank:
+            if section is sideboard:
+                break
+            section = sideboard
+            after_blank = False
 
-    # Sideboard is second section (if exists)
-    if len(sections) > 1:
-        for match in card_pattern.finditer(sections[1]):
-            qty, name = match.groups()
-            name = name.strip()
-            sideboard[name] = sideboard.get(name, 0) + int(qty)
+        if len(parts) == 2 and parts[0].isdecimal():
+            name = parts[1].strip()
+            section[name] = section.get(name, 0) + int(parts[0])
 
     return MetaDeck(
         name=summary.name,
@@ -225,16 +414,15 @@ def parse_deck_download(text: str, summary: DeckSummary) -> MetaDeck:
     )
 
 
+@lru_cache(maxsize=512)
 def _infer_archetype(deck_name: str) -> str:
     """Infer archetype from deck name."""
     name_lower = deck_name.lower()
 
-    if any(word in name_lower for word in ["aggro", "burn", "red deck", "sligh"]):
-        return "aggro"
-    if any(word in name_lower for word in ["control", "blue", "esper", "azorius"]):
-        return "control"
-    if any(word in name_lower for word in ["combo", "storm", "ramp"]):
-        return "combo"
+    for archetype, keywords in _ARCHETYPE_KEYWORDS:
+        for keyword in keywords:
+            if keyword in name_lower:
+                return archetype
 
     return "midrange"  # Default
 
@@ -243,6 +431,7 @@ def fetch_meta_decks(
     format_name: str,
     limit: int = 10,
     client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
 ) -> list[MetaDeck]:
     """
     Fetch top meta decks for a format.
@@ -255,7 +444,8 @@ def fetch_meta_decks(
     Args:
         format_name: Arena format (standard, historic, explorer, timeless)
         limit: Maximum number of decks to fetch
-        client: Optional httpx client for connection reuse
+        client: Optional httpx client. Defaults to the shared module client.
+        cache: Optional response cache (see fetch_metagame_page)
 
     Returns:
         List of MetaDeck with full card lists
@@ -264,21 +454,25 @@ def fetch_meta_decks(
         ValueError: If format is not valid
         httpx.HTTPError: If any request fails
     """
-    metagame_html = fetch_metagame_page(format_name, client)
-    summaries = parse_metagame_page(metagame_html, format_name)
+    # Reuse pooled connections for the metagame page and every deck,
+    # instead of a fresh TLS handshake per request
+    client, cache = _resolve_client(client, cache)
+
+    metagame_html = fetch_metagame_page(format_name, client, cache)
+    summaries = parse_metagame_page(metagame_html, format_name, limit)
 
     decks: list[MetaDeck] = []
-    for summary in summaries[:limit]:
+    for summary in summaries:
         try:
             # Fetch archetype page to get a deck ID
-            archetype_html = fetch_archetype_page(summary.url, client)
+            archetype_html = fetch_archetype_page(summary.url, client, cache)
             deck_id = extract_deck_id_from_archetype(archetype_html)
 
             if not deck_id:
                 continue
 
             # Download and parse the deck
-            deck_text = fetch_deck_download(deck_id, client)
+            deck_text = fetch_deck_download(deck_id, client, cache)
             deck = parse_deck_download(deck_text, summary)
 
             # Only add if we got cards (sanity check)
@@ -290,3 +484,79 @@ def fetch_meta_decks(
             continue
 
     return decks
+
+
+async def _fetch_deck_async(
+    summary: DeckSummary,
+    client: httpx.AsyncClient,
+    cache: ResponseCache | None,
+    semaphore: asyncio.Semaphore,
+) -> MetaDeck | None:
+    """Fetch one archetype's sample deck, or None if unavailable."""
+    try:
+        async with semaphore:
+            archetype_html = await _get_text_async(summary.url, client, cache)
+            deck_id = extract_deck_id_from_archetype(archetype_html)
+
+            if not deck_id:
+                return None
+
+            url = f"{MTGGOLDFISH_BASE}/deck/download/{deck_id}"
+            deck = parse_deck_download(await _get_text_async(url, client, cache), summary)
+
+    except httpx.HTTPError:
+        # Skip decks that fail to download
+        return None
+
+    # Only keep if we got cards (sanity check)
+    return deck if deck.cards else None
+
+
+async def fetch_meta_decks_async(
+    format_name: str,
+    limit: int = 10,
+    client: httpx.AsyncClient | None = None,
+    cache: ResponseCache | None = None,
+) -> list[MetaDeck]:
+    """
+    Fetch top meta decks for a format, downloading decks concurrently.
+
+    Same workflow and result as fetch_meta_decks, but the archetype page
+    and deck download for each summary run concurrently with the others
+    (at most MAX_CONCURRENT_FETCHES at a time), so total latency is a few
+    decks' round trips instead of limit's.
+
+    Args:
+        format_name: Arena format (standard, historic, explorer, timeless)
+        limit: Maximum number of decks to fetch
+        client: Optional async httpx client for connection reuse
+        cache: Optional response cache; none is used by default
+
+    Returns:
+        List of MetaDeck with full card lists, in metagame order
+
+    Raises:
+        ValueError: If format is not valid
+        httpx.HTTPError: If the metagame page request fails
+    """
+    if client is None:
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES),
+        ) as owned:
+            return await fetch_meta_decks_async(format_name, limit, owned, cache)
+
+    url = _METAGAME_URLS.get(format_name)
+    if url is None:
+        raise ValueError(f"Invalid format: {format_name}. Must be one of {VALID_FORMATS}")
+
+    metagame_html = await _get_text_async(url, client, cache)
+    summaries = parse_metagame_page(metagame_html, format_name, limit)
+
+    # Bound in-flight decks to stay polite to MTGGoldfish
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    results = await asyncio.gather(
+        *(_fetch_deck_async(summary, client, cache, semaphore) for summary in summaries)
+    )
+    return [deck for deck in results if deck is not None]
@@ -31,16 +31,12 @@ def format_deck_for_arena(deck: SanitizedDeck) -> str:
     Returns:
         Arena format string ready for import
     """
-    lines: list[str] = ["Deck"]
-
-    for card in deck.cards:
-        lines.append(_format_card_line(card))
+    lines = ["Deck"]
+    lines += [_format_card_line(c) for c in deck.cards]
 
     if deck.sideboard:
-        lines.append("")
-        lines.append("Sideboard")
-        for card in deck.sideboard:
-            lines.append(_format_card_line(card))
+        lines += ["", "Sideboard"]
+        lines += [_format_card_line(c) for c in deck.sideboard]
 
     return "\n".join(lines)
 
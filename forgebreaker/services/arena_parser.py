@@ -19,6 +19,7 @@ passed through the sanitizer before use.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 
 # =============================================================================
@@ -123,6 +124,12 @@ class ArenaParser:
         }
     )
 
+    # Every accepted header form, with and without a trailing colon (e.g. "deck:")
+    _ALL_HEADERS: frozenset[str] = KNOWN_SECTIONS | {s + ":" for s in KNOWN_SECTIONS}
+
+    # Lowercasing never shortens a string, so longer lines cannot be headers
+    _MAX_HEADER_LENGTH = max(len(header) for header in _ALL_HEADERS)
+
     def parse(self, raw_input: str) -> ParsedDeckStructure:
         """
         Parse raw Arena deck text to intermediate structure.
@@ -136,6 +143,11 @@ class ArenaParser:
         Returns:
             ParsedDeckStructure with extracted sections and entries
         """
+        # Fast path: nothing to split. isspace() stops at the first visible
+        # character and, unlike strip(), never copies the input.
+        if not raw_input or raw_input.isspace():
+            return ParsedDeckStructure(sections=[], unparseable_lines=[])
+
         lines = raw_input.split("\n")
 
         sections: list[ParsedSection] = []
@@ -151,9 +163,11 @@ class ArenaParser:
             if not stripped:
                 continue
 
-            # Check for section header
-            stripped_lower = stripped.lower()
-            if self._is_section_header(stripped, stripped_lower):
+            # Check for section header (card lines are usually too long to need .lower())
+            if (
+                len(stripped) <= self._MAX_HEADER_LENGTH
+                and (stripped_lower := stripped.lower()) in self._ALL_HEADERS
+            ):
                 # Start new section
                 current_section = ParsedSection(
                     name=stripped,
@@ -187,24 +201,6 @@ class ArenaParser:
             unparseable_lines=unparseable_lines,
         )
 
-    def _is_section_header(self, _line: str, line_lower: str) -> bool:
-        """
-        Check if a line is a section header.
-
-        Returns True for known section names (case-insensitive).
-        """
-        # Known section names
-        if line_lower in self.KNOWN_SECTIONS:
-            return True
-
-        # Also match with trailing colon (e.g., "Deck:")
-        if line_lower.endswith(":"):
-            base = line_lower[:-1]
-            if base in self.KNOWN_SECTIONS:
-                return True
-
-        return False
-
     def _parse_card_line(self, line: str, line_num: int) -> ParsedCardEntry | None:
         """
         Parse a single card line.
@@ -219,7 +215,7 @@ class ArenaParser:
             return ParsedCardEntry(
                 quantity_str=qty_str,
                 card_name=name,
-                set_code=set_code,
+                set_code=sys.intern(set_code),  # a handful of codes recur on every line
                 collector_number=collector_num,
                 line_number=line_num,
             )
@@ -66,9 +66,13 @@ WHAT DOES NOT LIVE IN THIS MODULE
 from __future__ import annotations
 
 import re
+import string
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+from forgebreaker.services.arena_formatter import format_deck_for_arena
 from forgebreaker.services.arena_parser import (
     ArenaParser,
     ParsedCardEntry,
@@ -118,14 +122,18 @@ REQUIRED_SECTIONS: frozenset[str] = frozenset(
     }
 )
 
-# Valid card name character pattern
-VALID_CARD_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9 ',\-/]+$")
+# Valid card name character pattern (use fullmatch; it also rejects control characters)
+VALID_CARD_NAME_PATTERN = re.compile(r"[a-zA-Z0-9 ',\-/]+")
 
-# Valid set code pattern (uppercase alphanumeric)
-VALID_SET_CODE_PATTERN = re.compile(r"^[A-Z0-9]+$")
+# Control characters, only searched to explain a name the pattern rejected
+CONTROL_CHARACTER_PATTERN = re.compile(r"[\x00-\x1f\x7f]")
 
-# Valid collector number pattern
-VALID_COLLECTOR_NUMBER_PATTERN = re.compile(r"^[a-zA-Z0-9]+$")
+# Valid set code characters (uppercase alphanumeric). Set codes and collector
+# numbers are a few characters long, where a frozenset superset test beats a regex.
+VALID_SET_CODE_CHARS: frozenset[str] = frozenset(string.ascii_uppercase + string.digits)
+
+# Valid collector number characters (alphanumeric)
+VALID_COLLECTOR_NUMBER_CHARS: frozenset[str] = frozenset(string.ascii_letters + string.digits)
 
 # Set codes that Arena does NOT accept
 ARENA_INVALID_SETS: frozenset[str] = frozenset(
@@ -172,6 +180,10 @@ ARENA_INVALID_SETS: frozenset[str] = frozenset(
     }
 )
 
+# Uppercase copy for set codes that are already canonicalized to uppercase,
+# so per-card checks need no .lower() allocation
+_ARENA_INVALID_SETS_UPPER: frozenset[str] = frozenset(s.upper() for s in ARENA_INVALID_SETS)
+
 
 # =============================================================================
 # EXCEPTION HIERARCHY
@@ -272,7 +284,7 @@ class DuplicateCardError(ArenaSanitizationError):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SanitizedCard:
     """
     A card with validated, Arena-safe information.
@@ -290,13 +302,14 @@ class SanitizedCard:
     collector_number: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SanitizedDeck:
     """
     A deck with all cards validated for Arena import.
 
     Construction of this object implies ALL validation has passed.
     This is an IMMUTABLE, TRUSTED data structure.
+    Cards and sideboard are each sorted by card name (canonical order).
 
     NOTE: This structure contains DATA ONLY.
     For formatting, use arena_formatter.format_deck_for_arena().
@@ -312,9 +325,6 @@ class SanitizedDeck:
         DEPRECATED: Use arena_formatter.format_deck_for_arena() instead.
         This method is kept for backwards compatibility only.
         """
-        # Import here to avoid circular import
-        from forgebreaker.services.arena_formatter import format_deck_for_arena
-
         return format_deck_for_arena(self)
 
 
@@ -648,18 +658,9 @@ class ArenaDeckSanitizer:
         if len(name) > MAX_CARD_NAME_LENGTH:
             raise InvalidCardNameError(name, f"Exceeds maximum length of {MAX_CARD_NAME_LENGTH}")
 
-        # Control character check
-        for char in name:
-            if ord(char) < 32 or ord(char) == 127:
-                raise InvalidCardNameError(name, f"Contains control character (ord={ord(char)})")
-
-        # Character class check
-        if not VALID_CARD_NAME_PATTERN.match(name):
-            raise InvalidCardNameError(
-                name,
-                "Contains invalid characters. "
-                "Only letters, numbers, spaces, apostrophes, commas, hyphens, slashes allowed.",
-            )
+        # Character class check (also rejects control characters)
+        if not VALID_CARD_NAME_PATTERN.fullmatch(name):
+            raise InvalidCardNameError(name, _invalid_card_name_reason(name))
 
         return name
 
@@ -693,34 +694,30 @@ class ArenaDeckSanitizer:
         """
         Validate explicitly provided printing info.
         """
-        # Validate set code format
-        if not set_code:
-            raise InvalidSetCodeError(card_name, set_code, "Set code cannot be empty")
-
-        if len(set_code) > MAX_SET_CODE_LENGTH:
-            raise InvalidSetCodeError(
-                card_name, set_code, f"Exceeds maximum length of {MAX_SET_CODE_LENGTH}"
-            )
-
-        if not VALID_SET_CODE_PATTERN.match(set_code):
+        # Validate set code format (one check; the branches only pick the reason)
+        if not _is_valid_set_code(set_code):
+            if not set_code:
+                raise InvalidSetCodeError(card_name, set_code, "Set code cannot be empty")
+            if len(set_code) > MAX_SET_CODE_LENGTH:
+                raise InvalidSetCodeError(
+                    card_name, set_code, f"Exceeds maximum length of {MAX_SET_CODE_LENGTH}"
+                )
             raise InvalidSetCodeError(card_name, set_code, "Must be uppercase alphanumeric")
 
         # Validate collector number format
-        if not collector_number:
-            raise InvalidCollectorNumberError(card_name, collector_number, "Cannot be empty")
-
-        if len(collector_number) > MAX_COLLECTOR_NUMBER_LENGTH:
-            raise InvalidCollectorNumberError(
-                card_name,
-                collector_number,
-                f"Exceeds maximum length of {MAX_COLLECTOR_NUMBER_LENGTH}",
-            )
-
-        if not VALID_COLLECTOR_NUMBER_PATTERN.match(collector_number):
+        if not _is_valid_collector_number(collector_number):
+            if not collector_number:
+                raise InvalidCollectorNumberError(card_name, collector_number, "Cannot be empty")
+            if len(collector_number) > MAX_COLLECTOR_NUMBER_LENGTH:
+                raise InvalidCollectorNumberError(
+                    card_name,
+                    collector_number,
+                    f"Exceeds maximum length of {MAX_COLLECTOR_NUMBER_LENGTH}",
+                )
             raise InvalidCollectorNumberError(card_name, collector_number, "Must be alphanumeric")
 
-        # Check if set is known-invalid
-        if set_code.lower() in ARENA_INVALID_SETS:
+        # Check if set is known-invalid (set_code is uppercase once validated)
+        if set_code in _ARENA_INVALID_SETS_UPPER:
             raise ArenaImportabilityError(
                 card_name, set_code, f"Set '{set_code}' is not valid for Arena import"
             )
@@ -728,7 +725,7 @@ class ArenaDeckSanitizer:
         # Check Arena availability if we have card data
         card_data = self._card_db.get(card_name)
         if card_data:
-            games = card_data.get("games", [])
+            games = card_data.get("games", ())
             if "arena" not in games:
                 raise ArenaImportabilityError(card_name, set_code, "Card is not available on Arena")
 
@@ -748,7 +745,7 @@ class ArenaDeckSanitizer:
             )
 
         # Check Arena availability
-        games = card_data.get("games", [])
+        games = card_data.get("games", ())
         if "arena" not in games:
             raise ArenaImportabilityError(
                 card_name,
@@ -760,10 +757,10 @@ class ArenaDeckSanitizer:
         db_set = card_data.get("set", "")
         if not db_set:
             raise ArenaImportabilityError(card_name, "UNKNOWN", "No set information available")
-        db_set = db_set.upper()
+        db_set = sys.intern(db_set.upper())
 
         # Check if set is valid
-        if db_set.lower() in ARENA_INVALID_SETS:
+        if db_set in _ARENA_INVALID_SETS_UPPER:
             raise ArenaImportabilityError(
                 card_name, db_set, f"Set '{db_set}' is not valid for Arena import"
             )
@@ -771,9 +768,9 @@ class ArenaDeckSanitizer:
         db_collector = str(card_data.get("collector_number", "1"))
 
         # Validate database values
-        if not VALID_SET_CODE_PATTERN.match(db_set):
+        if not _is_valid_set_code(db_set):
             raise InvalidSetCodeError(card_name, db_set, "Database set code is malformed")
-        if not VALID_COLLECTOR_NUMBER_PATTERN.match(db_collector):
+        if not _is_valid_collector_number(db_collector):
             raise InvalidCollectorNumberError(
                 card_name, db_collector, "Database collector number is malformed"
             )
@@ -830,16 +827,33 @@ def validate_card_name(name: str) -> None:
     if len(name) > MAX_CARD_NAME_LENGTH:
         raise InvalidCardNameError(name, f"Exceeds maximum length of {MAX_CARD_NAME_LENGTH}")
 
-    for char in name:
-        if ord(char) < 32 or ord(char) == 127:
-            raise InvalidCardNameError(name, f"Contains control character (ord={ord(char)})")
+    if not VALID_CARD_NAME_PATTERN.fullmatch(name):
+        raise InvalidCardNameError(name, _invalid_card_name_reason(name))
 
-    if not VALID_CARD_NAME_PATTERN.match(name):
-        raise InvalidCardNameError(
-            name,
-            "Contains invalid characters. "
-            "Only letters, numbers, spaces, apostrophes, commas, hyphens, slashes allowed.",
-        )
+
+def _invalid_card_name_reason(name: str) -> str:
+    """Explain why a name failed VALID_CARD_NAME_PATTERN (error path only)."""
+    control = CONTROL_CHARACTER_PATTERN.search(name)
+    if control:
+        return f"Contains control character (ord={ord(control.group())})"
+    return (
+        "Contains invalid characters. "
+        "Only letters, numbers, spaces, apostrophes, commas, hyphens, slashes allowed."
+    )
+
+
+def _is_valid_set_code(set_code: str) -> bool:
+    """Non-empty, within MAX_SET_CODE_LENGTH, only VALID_SET_CODE_CHARS."""
+    if not 0 < len(set_code) <= MAX_SET_CODE_LENGTH:
+        return False
+    return VALID_SET_CODE_CHARS.issuperset(set_code)
+
+
+def _is_valid_collector_number(collector_number: str) -> bool:
+    """Non-empty, within MAX_COLLECTOR_NUMBER_LENGTH, only VALID_COLLECTOR_NUMBER_CHARS."""
+    if not 0 < len(collector_number) <= MAX_COLLECTOR_NUMBER_LENGTH:
+        return False
+    return VALID_COLLECTOR_NUMBER_CHARS.issuperset(collector_number)
 
 
 def validate_quantity(card_name: str, quantity: int) -> None:
@@ -868,6 +882,10 @@ def validate_set_code(card_name: str, set_code: str) -> None:
     Raises:
         InvalidSetCodeError: If set code is invalid
     """
+    # One check covers emptiness, length and charset; the branches only pick the reason
+    if _is_valid_set_code(set_code):
+        return
+
     if not set_code:
         raise InvalidSetCodeError(card_name, set_code, "Cannot be empty")
 
@@ -876,8 +894,7 @@ def validate_set_code(card_name: str, set_code: str) -> None:
             card_name, set_code, f"Exceeds maximum length of {MAX_SET_CODE_LENGTH}"
         )
 
-    if not VALID_SET_CODE_PATTERN.match(set_code):
-        raise InvalidSetCodeError(card_name, set_code, "Must be uppercase alphanumeric")
+    raise InvalidSetCodeError(card_name, set_code, "Must be uppercase alphanumeric")
 
 
 def validate_collector_number(card_name: str, collector_number: str) -> None:
@@ -887,6 +904,10 @@ def validate_collector_number(card_name: str, collector_number: str) -> None:
     Raises:
         InvalidCollectorNumberError: If collector number is invalid
     """
+    # One check covers emptiness, length and charset; the branches only pick the reason
+    if _is_valid_collector_number(collector_number):
+        return
+
     if not collector_number:
         raise InvalidCollectorNumberError(card_name, collector_number, "Cannot be empty")
 
@@ -897,8 +918,7 @@ def validate_collector_number(card_name: str, collector_number: str) -> None:
             f"Exceeds maximum length of {MAX_COLLECTOR_NUMBER_LENGTH}",
         )
 
-    if not VALID_COLLECTOR_NUMBER_PATTERN.match(collector_number):
-        raise InvalidCollectorNumberError(card_name, collector_number, "Must be alphanumeric")
+    raise InvalidCollectorNumberError(card_name, collector_number, "Must be alphanumeric")
 
 
 # =============================================================================
@@ -944,40 +964,19 @@ def sanitize_deck_for_arena(
     if total_cards < MIN_TOTAL_CARDS:
         raise InvalidDeckStructureError(f"Deck must have at least {MIN_TOTAL_CARDS} card")
 
-    # Validate and build maindeck
-    sanitized_cards: list[SanitizedCard] = []
-    for card_name, quantity in sorted(cards.items()):
-        validate_card_name(card_name)
-        validate_quantity(card_name, quantity)
+    # Validate and build maindeck and sideboard in input order
+    sanitized_cards = [
+        _sanitize_dict_entry(card_name, quantity, card_db) for card_name, quantity in cards.items()
+    ]
+    sanitized_sideboard = [
+        _sanitize_dict_entry(card_name, quantity, card_db)
+        for card_name, quantity in (sideboard or {}).items()
+    ]
 
-        set_code, collector_number = _get_canonical_printing(card_name, card_db)
-
-        sanitized_cards.append(
-            SanitizedCard(
-                name=card_name,
-                quantity=quantity,
-                set_code=set_code,
-                collector_number=collector_number,
-            )
-        )
-
-    # Validate and build sideboard
-    sanitized_sideboard: list[SanitizedCard] = []
-    if sideboard:
-        for card_name, quantity in sorted(sideboard.items()):
-            validate_card_name(card_name)
-            validate_quantity(card_name, quantity)
-
-            set_code, collector_number = _get_canonical_printing(card_name, card_db)
-
-            sanitized_sideboard.append(
-                SanitizedCard(
-                    name=card_name,
-                    quantity=quantity,
-                    set_code=set_code,
-                    collector_number=collector_number,
-                )
-            )
+    # Canonicalize (sort alphabetically); sorting the built cards by name is
+    # cheaper than sorting the (name, quantity) input pairs
+    sanitized_cards.sort(key=lambda c: c.name)
+    sanitized_sideboard.sort(key=lambda c: c.name)
 
     return SanitizedDeck(
         cards=tuple(sanitized_cards),
@@ -985,6 +984,25 @@ def sanitize_deck_for_arena(
     )
 
 
+def _sanitize_dict_entry(
+    card_name: str,
+    quantity: int,
+    card_db: dict[str, dict[str, Any]],
+) -> SanitizedCard:
+    """Validate one {name: quantity} entry and resolve its printing."""
+    validate_card_name(card_name)
+    validate_quantity(card_name, quantity)
+
+    set_code, collector_number = _get_canonical_printing(card_name, card_db)
+
+    return SanitizedCard(
+        name=card_name,
+        quantity=quantity,
+        set_code=set_code,
+        collector_number=collector_number,
+    )
+
+
 def _get_canonical_printing(
     card_name: str,
     card_db: dict[str, dict[str, Any]],
@@ -995,7 +1013,7 @@ def _get_canonical_printing(
         raise ArenaImportabilityError(card_name, "UNKNOWN", "Card not found in database")
 
     # Check Arena availability
-    games = card_data.get("games", [])
+    games = card_data.get("games", ())
     if "arena" not in games:
         raise ArenaImportabilityError(
             card_name,
@@ -1003,18 +1021,33 @@ def _get_canonical_printing(
             "Card is not available on Arena",
         )
 
-    # Get and validate set code
-    set_code = card_data.get("set", "").upper()
+    return _resolve_printing(
+        card_name,
+        card_data.get("set", ""),
+        str(card_data.get("collector_number", "1")),
+    )
+
+
+@lru_cache(maxsize=8192)
+def _resolve_printing(card_name: str, db_set: str, collector_number: str) -> tuple[str, str]:
+    """
+    Canonicalize and validate a database printing.
+
+    A pure function of its arguments, so results are cached by value:
+    re-sanitizing the same cards skips the set and collector checks, and
+    edits to card_db simply produce new keys. Failures raise and are
+    never cached.
+    """
+    # Get and validate set code (interned: a handful of codes recur across every deck)
+    set_code = sys.intern(db_set.upper())
     if not set_code:
         raise ArenaImportabilityError(card_name, "UNKNOWN", "No set information available")
 
-    if set_code.lower() in ARENA_INVALID_SETS:
+    if set_code in _ARENA_INVALID_SETS_UPPER:
         raise ArenaImportabilityError(
             card_name, set_code, f"Set '{set_code}' is not valid for Arena import"
         )
 
-    collector_number = str(card_data.get("collector_number", "1"))
-
     # Validate output
     validate_set_code(card_name, set_code)
     validate_collector_number(card_name, collector_number)
@@ -1056,7 +1089,7 @@ def is_arena_valid_printing(set_code: str, card_data: dict[str, Any]) -> bool:
     """Check if a printing is valid for Arena."""
     if set_code.lower() in ARENA_INVALID_SETS:
         return False
-    games = card_data.get("games", [])
+    games = card_data.get("games", ())
     return "arena" in games
 
 
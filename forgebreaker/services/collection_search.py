@@ -22,6 +22,9 @@ from forgebreaker.models.failure import FailureKind, KnownError
 
 logger = logging.getLogger(__name__)
 
+# Leading integer of a power/toughness value such as "2+*"
+_LEADING_INT_PATTERN = re.compile(r"-?\d+")
+
 
 @dataclass
 class CardSearchResult:
@@ -298,9 +301,9 @@ def _parse_pt(value: str) -> int | None:
     if value.isdigit() or (value.startswith("-") and len(value) > 1 and value[1:].isdigit()):
         return int(value)
     # Try to extract leading number (e.g., "2" from "2+*")
-    match = re.match(r"^(-?\d+)", value)
+    match = _LEADING_INT_PATTERN.match(value)
     if match:
-        return int(match.group(1))
+        return int(match.group())
     return None
 
 
@@ -53,6 +53,11 @@ _COLOR_WORDS: dict[str, str] = {
     "g": "G",
 }
 
+# Word-boundary patterns for the color words, compiled once at import
+_COLOR_WORD_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(rf"\b{word}\b"), code) for word, code in _COLOR_WORDS.items()
+]
+
 # Guild/clan names map to color pairs
 _COLOR_PAIRS: dict[str, frozenset[str]] = {
     # Ravnica guilds
@@ -193,9 +198,9 @@ def _extract_colors(text: str) -> frozenset[str] | None:
             colors.update(color_set)
 
     # Check individual color words
-    for word, code in _COLOR_WORDS.items():
+    for pattern, code in _COLOR_WORD_PATTERNS:
         # Use word boundary matching for color words
-        if re.search(rf"\b{word}\b", text_lower):
+        if pattern.search(text_lower):
             colors.add(code)
 
     # Validate colors
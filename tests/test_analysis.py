@@ -9,9 +9,11 @@ from forgebreaker.analysis.ranker import (
     rank_decks,
     rank_decks_with_ml,
 )
+from forgebreaker.analysis.stress import apply_stress
 from forgebreaker.ml.inference import RecommendationScore
 from forgebreaker.models.collection import Collection
 from forgebreaker.models.deck import MetaDeck
+from forgebreaker.models.stress import StressScenario, StressType
 
 
 @pytest.fixture
@@ -530,3 +532,35 @@ class TestRankDecksWithML:
         # Verify score_decks was called with 3 feature sets
         call_args = mock_client.score_decks.call_args[0][0]
         assert len(call_args) == 3
+
+
+class TestApplyStress:
+    def test_zero_intensity_leaves_fragility_unchanged(self, sample_deck: MetaDeck) -> None:
+        scenario = StressScenario(
+            stress_type=StressType.MISSING, target="Lightning Bolt", intensity=0.0
+        )
+
+        result = apply_stress(sample_deck, {}, scenario)
+
+        assert result.scenario is scenario
+        assert result.stressed_fragility == result.original_fragility
+        assert result.affected_assumptions == []
+        assert not result.has_significant_change()
+
+    def test_zero_intensity_still_reports_critical_key_card_dependency(self) -> None:
+        # 36 one-ofs leave no key cards at all, which is already critical
+        cards = {f"Card {i}": 1 for i in range(36)}
+        cards["Mountain"] = 24
+        deck = MetaDeck(name="Pile", archetype="midrange", format="standard", cards=cards)
+        card_db = {
+            name: {"type_line": "Creature", "cmc": 3, "mana_cost": "{2}{R}", "colors": ["R"]}
+            for name in cards
+        }
+        card_db["Mountain"] = {"type_line": "Basic Land — Mountain", "cmc": 0, "colors": []}
+
+        for stress_type in (StressType.UNDERPERFORM, StressType.HOSTILE_META):
+            scenario = StressScenario(stress_type=stress_type, target="all", intensity=0.0)
+            result = apply_stress(deck, card_db, scenario)
+
+            assert result.assumption_violated
+            assert [a.name for a in result.affected_assumptions] == ["Key Card Dependency"]
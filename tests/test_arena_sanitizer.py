@@ -26,6 +26,7 @@ The tests prove:
 - Parser success does NOT imply sanitizer success
 """
 
+import sys
 from typing import Any
 
 import pytest
@@ -153,6 +154,20 @@ class TestArchitectureBoundary:
         # Parser produces intermediate structure
         assert parsed.sections[0].entries[0].card_name == "Some Card"
 
+    def test_parser_recognizes_header_forms(self) -> None:
+        """Headers match case-insensitively, with or without a trailing colon."""
+        parsed = ArenaParser().parse("DECK:\n4 Some Card\nsideboard\n1 Other Card\nDecks")
+
+        assert [s.name for s in parsed.sections] == ["DECK:", "sideboard"]
+        assert parsed.unparseable_lines == [(5, "Decks")]
+
+    def test_parser_empty_input(self) -> None:
+        """Empty and whitespace-only input parse to an empty structure."""
+        for raw_input in ("", "  \n\t\r\n"):
+            parsed = ArenaParser().parse(raw_input)
+            assert parsed.sections == []
+            assert parsed.unparseable_lines == []
+
     def test_parser_does_not_validate(self) -> None:
         """Parser extracts structure without validating values."""
         parser = ArenaParser()
@@ -222,6 +237,21 @@ Sideboard
         with pytest.raises((TypeError, AttributeError)):
             result.cards = ()  # type: ignore[misc]
 
+    def test_set_codes_are_interned(self, sanitizer: ArenaDeckSanitizer) -> None:
+        """Sanitized set codes are interned strings."""
+        result = sanitizer.sanitize("Deck\n4 Lightning Bolt (STA) 42\n4 Shock")
+
+        bolt, shock = result.cards
+        assert bolt.set_code is sys.intern("STA")
+        assert shock.set_code is sys.intern("M21")
+
+    def test_sanitized_structures_use_slots(self, sanitizer: ArenaDeckSanitizer) -> None:
+        """SanitizedCard and SanitizedDeck use slots for memory efficiency."""
+        result = sanitizer.sanitize("Deck\n4 Lightning Bolt (STA) 42")
+
+        assert not hasattr(result.cards[0], "__dict__")
+        assert not hasattr(result, "__dict__")
+
     def test_output_is_canonicalized(self, sanitizer: ArenaDeckSanitizer) -> None:
         """Output is alphabetically ordered (canonicalized)."""
         raw_input = """Deck
@@ -556,6 +586,18 @@ class TestArenaImportability:
         with pytest.raises(ArenaImportabilityError):
             sanitizer.sanitize(raw_input)
 
+    def test_invalid_set_rejected(self, card_db: dict[str, dict[str, Any]]) -> None:
+        """Known-invalid sets are rejected whether given explicitly or from the db."""
+        sanitizer = ArenaDeckSanitizer(card_db)
+        with pytest.raises(ArenaImportabilityError):
+            sanitizer.sanitize("Deck\n4 Lightning Bolt (SLD) 42")
+
+        card_db["Lightning Bolt"]["set"] = "sld"
+        with pytest.raises(ArenaImportabilityError):
+            sanitizer.sanitize("Deck\n4 Lightning Bolt")
+        with pytest.raises(ArenaImportabilityError):
+            sanitize_deck_for_arena({"Lightning Bolt": 4}, card_db)
+
 
 # =============================================================================
 # CONVENIENCE FUNCTION TESTS
@@ -611,6 +653,27 @@ class TestSanitizeDeckForArena:
         with pytest.raises(InvalidQuantityError):
             sanitize_deck_for_arena(cards, card_db)
 
+    def test_arena_format_with_sideboard(self, card_db: dict[str, dict[str, Any]]) -> None:
+        """Export lists the maindeck, a blank line, then the sideboard."""
+        result = sanitize_deck_for_arena(
+            {"Mountain": 20, "Lightning Bolt": 4}, card_db, sideboard={"Shock": 2}
+        )
+
+        assert result.to_arena_format() == (
+            "Deck\n4 Lightning Bolt (STA) 42\n20 Mountain (DMU) 269\n\nSideboard\n2 Shock (M21) 159"
+        )
+
+    def test_printing_cache_follows_db_changes(self, card_db: dict[str, dict[str, Any]]) -> None:
+        """Cached printings are keyed by value, so db edits are picked up."""
+        cards = {"Lightning Bolt": 4}
+        first = sanitize_deck_for_arena(cards, card_db)
+        assert sanitize_deck_for_arena(cards, card_db) == first
+
+        card_db["Lightning Bolt"]["collector_number"] = "43"
+        result = sanitize_deck_for_arena(cards, card_db)
+
+        assert result.cards[0].collector_number == "43"
+
     def test_empty_dict_rejected(self, card_db: dict[str, dict[str, Any]]) -> None:
         """Empty dict is rejected."""
         with pytest.raises(InvalidDeckStructureError) as exc_info:
@@ -641,6 +704,12 @@ class TestValidateCardName:
         with pytest.raises(InvalidCardNameError):
             validate_card_name("Test\x00Card")
 
+    def test_trailing_newline_rejected(self) -> None:
+        """A trailing newline is reported as a control character."""
+        with pytest.raises(InvalidCardNameError) as exc_info:
+            validate_card_name("Lightning Bolt\n")
+        assert "ord=10" in str(exc_info.value)
+
     def test_valid_names_pass(self) -> None:
         """Valid names pass."""
         validate_card_name("Lightning Bolt")
@@ -691,6 +760,15 @@ class TestValidateSetCode:
         with pytest.raises(InvalidSetCodeError):
             validate_set_code("Test", "sta")
 
+    def test_reasons_preserved(self) -> None:
+        """Rejections still report the specific reason."""
+        with pytest.raises(InvalidSetCodeError, match="Cannot be empty"):
+            validate_set_code("Test", "")
+        with pytest.raises(InvalidSetCodeError, match="maximum length"):
+            validate_set_code("Test", "A" * 11)
+        with pytest.raises(InvalidSetCodeError, match="uppercase alphanumeric"):
+            validate_set_code("Test", "STA\n")
+
     def test_valid_codes_pass(self) -> None:
         """Valid set codes pass."""
         validate_set_code("Test", "STA")
@@ -705,6 +783,13 @@ class TestValidateCollectorNumber:
         with pytest.raises(InvalidCollectorNumberError):
             validate_collector_number("Test", "")
 
+    def test_too_long_and_trailing_newline_rejected(self) -> None:
+        """Over-long numbers and a trailing newline are rejected."""
+        with pytest.raises(InvalidCollectorNumberError, match="maximum length"):
+            validate_collector_number("Test", "1" * 11)
+        with pytest.raises(InvalidCollectorNumberError, match="alphanumeric"):
+            validate_collector_number("Test", "42\n")
+
     def test_valid_numbers_pass(self) -> None:
         """Valid collector numbers pass."""
         validate_collector_number("Test", "42")
@@ -9,6 +9,8 @@ These tests verify the core system invariant:
 These tests MUST fail on any codebase that allows card name leakage.
 """
 
+import sys
+
 import pytest
 
 from forgebreaker.models.validated_deck import ValidatedDeck, create_validated_deck
@@ -305,6 +307,23 @@ class TestValidatedDeck:
         assert "Lightning Bolt" in deck
         assert "Pyroblast" in deck
 
+    def test_card_names_are_interned(self) -> None:
+        """Entry tuples and the card set share one interned string per name."""
+        name = "".join(["Lightning ", "Bolt"])  # built at runtime, not interned
+        deck = create_validated_deck(maindeck={name: 4}, validation_source="test")
+
+        stored = deck.maindeck[0][0]
+        assert stored is sys.intern("Lightning Bolt")
+        assert next(iter(deck.cards)) is stored
+
+    def test_entries_sorted_by_name(self) -> None:
+        """Entries are sorted by card name regardless of input order."""
+        maindeck = {"Mountain": 20, "Lightning Bolt": 4}
+
+        deck = create_validated_deck(maindeck=maindeck, validation_source="test")
+
+        assert deck.maindeck == (("Lightning Bolt", 4), ("Mountain", 20))
+
 
 class TestCanonicalCardMatching:
     """
@@ -3,6 +3,12 @@ import pytest
 from forgebreaker.models.card import Card
 from forgebreaker.models.collection import Collection
 from forgebreaker.models.deck import DeckDistance, MetaDeck, RankedDeck, WildcardCost
+from forgebreaker.models.stress import (
+    StressedAssumption,
+    StressResult,
+    StressScenario,
+    StressType,
+)
 
 
 class TestCard:
@@ -142,3 +148,53 @@ class TestRankedDeck:
         assert ranked.can_build_now is False
         assert ranked.within_budget is True
         assert ranked.recommendation_reason == "High win rate with low wildcard cost"
+
+
+class TestStressResult:
+    @staticmethod
+    def _result(violated: bool = False) -> StressResult:
+        return StressResult(
+            deck_name="Mono-Red",
+            scenario=StressScenario(stress_type=StressType.MISSING, target="Lightning Bolt"),
+            original_fragility=0.2,
+            stressed_fragility=0.4,
+            affected_assumptions=[
+                StressedAssumption(
+                    name="Curve",
+                    original_value=2.0,
+                    stressed_value=3.0,
+                    original_health="healthy",
+                    stressed_health="warning",
+                    change_explanation="Curve shifts up",
+                    belief_violated=violated,
+                )
+            ],
+        )
+
+    def test_significant_change_from_assumption(self) -> None:
+        assert self._result(violated=True).has_significant_change()
+        assert not self._result(violated=False).has_significant_change()
+
+    def test_significant_change_reflects_mutation(self) -> None:
+        result = self._result(violated=False)
+        assert not result.has_significant_change()
+
+        result.assumption_violated = True
+        assert result.has_significant_change()
+
+    def test_stress_models_use_slots(self) -> None:
+        result = self._result()
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.scenario, "__dict__")
+        assert not hasattr(result.affected_assumptions[0], "__dict__")
+
+    def test_zero_intensity_scenario_is_noop(self) -> None:
+        assert StressScenario(StressType.DELAYED, "mana_curve", intensity=0.0).is_noop
+        assert StressScenario(StressType.DELAYED, "mana_curve", intensity=-0.5).is_noop
+        assert not StressScenario(StressType.DELAYED, "mana_curve", intensity=0.25).is_noop
+
+    def test_is_noop_tracks_intensity_changes(self) -> None:
+        scenario = StressScenario(StressType.DELAYED, "mana_curve", intensity=0.0)
+        scenario.intensity = 0.5
+
+        assert not scenario.is_noop
@@ -10,6 +10,9 @@ This makes rotation changes testable and prevents silent legality shifts.
 These tests exist to prevent regression - the system must always use oracle data.
 """
 
+import pickle
+from datetime import date
+
 import pytest
 
 from forgebreaker.filtering.candidate_pool import (
@@ -20,9 +23,11 @@ from forgebreaker.models.canonical_card import InventoryCard
 from forgebreaker.models.intent import DeckIntent, Format
 from forgebreaker.models.legality_context import (
     CURRENT_ROTATION_VERSION,
+    ROTATION_VERSIONS,
     LegalityContext,
     LegalityFormat,
     LegalityResult,
+    _RotationIndex,
     check_legality,
     filter_by_legality,
 )
@@ -429,6 +434,72 @@ class TestLegalityContextModel:
         ctx_historic = LegalityContext.current(LegalityFormat.HISTORIC)
         assert ctx_historic.format_name == "historic"
 
+    def test_context_format_name_is_plain_string(self) -> None:
+        """format_name is cached as a plain str and excluded from equality."""
+        ctx = LegalityContext.current(LegalityFormat.STANDARD)
+
+        assert type(ctx.format_name) is str
+        assert ctx == LegalityContext(format=LegalityFormat.STANDARD)
+        assert "format_name" not in repr(ctx)
+
+    def test_context_hash_is_stable_and_consistent_with_eq(self) -> None:
+        """Equal contexts hash equally and work as dict keys."""
+        ctx = LegalityContext.current(LegalityFormat.STANDARD)
+        same = LegalityContext(format=LegalityFormat.STANDARD)
+
+        assert hash(ctx) == hash(ctx) == hash(same)
+        assert {ctx: "cached"}[same] == "cached"
+        assert hash(ctx) != hash(LegalityContext.current(LegalityFormat.HISTORIC))
+
+    def test_context_pickle_round_trip_keeps_hash_consistent(self) -> None:
+        """Unpickled contexts carry no stale hash and match equal live contexts."""
+        ctx = LegalityContext.current(LegalityFormat.STANDARD)
+        restored = pickle.loads(pickle.dumps(ctx))
+
+        assert restored == ctx
+        assert hash(restored) == hash(ctx)
+        assert {ctx: "cached"}.get(restored) == "cached"
+
+
+class TestRotationLookup:
+    """Tests for date -> rotation version resolution."""
+
+    def test_at_date_picks_most_recent_rotation(self) -> None:
+        """at_date() resolves to the latest rotation on or before the date."""
+        ctx = LegalityContext.at_date(LegalityFormat.STANDARD, date(2024, 11, 15))
+        assert ctx.rotation_version == "2024-Q4"
+
+        on_boundary = LegalityContext.at_date(LegalityFormat.STANDARD, date(2025, 1, 1))
+        assert on_boundary.rotation_version == "2025-Q1"
+
+    def test_at_date_before_first_rotation_uses_current(self) -> None:
+        """Dates before every known rotation fall back to the current version."""
+        ctx = LegalityContext.at_date(LegalityFormat.STANDARD, date(2000, 1, 1))
+        assert ctx.rotation_version == CURRENT_ROTATION_VERSION
+
+    def test_index_keeps_date_order_on_add(self) -> None:
+        """Versions added out of order are still resolved by date."""
+        index = _RotationIndex({"2025-Q4": date(2025, 10, 1)})
+        index.add("2024-Q4", date(2024, 10, 1))
+        index.add("2025-Q1", date(2025, 1, 1))
+
+        assert index.at_date(date(2024, 12, 31)) == "2024-Q4"
+        assert index.at_date(date(2025, 6, 1)) == "2025-Q1"
+        assert index.at_date(date(2026, 1, 1)) == "2025-Q4"
+        assert index.at_date(date(2024, 1, 1)) is None
+
+    def test_index_rejects_duplicate_version(self) -> None:
+        """Re-registering a version is an error."""
+        index = _RotationIndex({"2025-Q1": date(2025, 1, 1)})
+
+        with pytest.raises(ValueError, match="already registered"):
+            index.add("2025-Q1", date(2025, 2, 1))
+
+    def test_rotation_versions_is_read_only(self) -> None:
+        """ROTATION_VERSIONS cannot be mutated directly."""
+        with pytest.raises(TypeError):
+            ROTATION_VERSIONS["2099-Q1"] = date(2099, 1, 1)  # type: ignore[index]
+
 
 class TestCheckLegalityWithContext:
     """
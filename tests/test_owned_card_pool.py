@@ -19,6 +19,7 @@ from forgebreaker.models.canonical_card import (
 )
 from forgebreaker.models.owned_card_pool import (
     DEFAULT_MAX_COPIES,
+    MAX_OVERLAY_DEPTH,
     CopyLimitExceededError,
     OwnedCardPool,
     build_owned_pool,
@@ -674,3 +675,77 @@ class TestConsumeCopies:
         # Card is no longer in pool
         assert "Lightning Bolt" not in remaining
         assert remaining.get_count("Lightning Bolt") == 0
+
+    def test_consume_copies_chain_matches_flat_pool(self) -> None:
+        """
+        Chained consumption resolves to the same counts as a flat pool.
+        """
+        pool = OwnedCardPool.from_dict({"Lightning Bolt": 4, "Mountain": 20, "Shock": 4})
+
+        remaining = pool.consume_copies({"Mountain": 4}).consume_copies(
+            {"Mountain": 4, "Lightning Bolt": 4}
+        )
+
+        assert remaining.get_count("Mountain") == 12
+        assert remaining.get_count("Shock") == 4
+        assert "Lightning Bolt" not in remaining
+        assert remaining.to_dict() == {"Mountain": 12, "Shock": 4}
+        assert dict(remaining.items()) == {"Mountain": 12, "Shock": 4}
+        assert len(remaining) == 2
+        assert remaining.total_cards() == 16
+        assert remaining == OwnedCardPool.from_dict({"Mountain": 12, "Shock": 4})
+
+    def test_consume_copies_validates_against_remaining(self) -> None:
+        """
+        A consumed pool enforces its remaining counts, not the original ones.
+        """
+        pool = OwnedCardPool.from_dict({"Lightning Bolt": 4})
+        remaining = pool.consume_copies({"Lightning Bolt": 3})
+
+        with pytest.raises(CopyLimitExceededError) as exc_info:
+            remaining.consume_copies({"Lightning Bolt": 2})
+
+        assert exc_info.value.available == 1
+
+    def test_deep_consume_chain_is_collapsed(self) -> None:
+        """
+        Long consume chains are materialized to bound lookup depth.
+        """
+        pool = OwnedCardPool.from_dict({"Mountain": 100})
+
+        for _ in range(MAX_OVERLAY_DEPTH * 2):
+            pool = pool.consume_copies({"Mountain": 1})
+
+        assert pool._depth < MAX_OVERLAY_DEPTH
+        assert pool.get_count("Mountain") == 100 - MAX_OVERLAY_DEPTH * 2
+
+    def test_overlay_repr_shows_resolved_counts(self) -> None:
+        """
+        repr() of an overlay shows the effective pool, not just its own entries.
+        """
+        pool = OwnedCardPool.from_dict({"Lightning Bolt": 4, "Mountain": 20})
+        remaining = pool.consume_copies({"Mountain": 4})
+
+        assert repr(remaining) == repr(OwnedCardPool.from_dict(remaining.to_dict()))
+        assert "Lightning Bolt" in repr(remaining)
+
+    def test_overlay_resolves_chain_once(self) -> None:
+        """
+        Whole-pool reads on an overlay reuse one resolved view.
+        """
+        pool = OwnedCardPool.from_dict({"Lightning Bolt": 4, "Mountain": 20})
+        remaining = pool.consume_copies({"Mountain": 4}).consume_copies({"Mountain": 4})
+
+        assert remaining._flat_cards() is remaining._flat_cards()
+        assert len(remaining) == 2
+        assert remaining.total_cards() == 16
+
+    def test_materialize_returns_standalone_pool(self) -> None:
+        """
+        materialize() drops the parent link but keeps the counts.
+        """
+        pool = OwnedCardPool.from_dict({"Lightning Bolt": 4, "Mountain": 20})
+        flat = pool.consume_copies({"Mountain": 4}).materialize()
+
+        assert flat._parent is None
+        assert flat.to_dict() == {"Lightning Bolt": 4, "Mountain": 16}
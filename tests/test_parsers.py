@@ -2,6 +2,7 @@ from pathlib import Path
 
 from forgebreaker.models.card import Card
 from forgebreaker.parsers.arena_export import (
+    _parse_arena_line,
     cards_to_collection,
     parse_arena_export,
     parse_arena_to_collection,
@@ -71,6 +72,40 @@ Sideboard
         assert result[0].name == "Lightning Bolt"
         assert result[1].name == "Abrade"
 
+    def test_parse_line_edge_cases(self) -> None:
+        """Edge cases keep the historical regex semantics."""
+        cases = {
+            "4 Lightning Bolt (LEB) 163": (4, "Lightning Bolt", "LEB", "163"),
+            "4\tFire // Ice  (MH2)\t290": (4, "Fire // Ice", "MH2", "290"),
+            "1 Name (With Parens) (M21) 7": (1, "Name (With Parens)", "M21", "7"),
+            "4 Lightning Bolt (leb) 163": (4, "Lightning Bolt (leb) 163", None, None),
+            "4 Lightning Bolt(LEB) 163": (4, "Lightning Bolt(LEB) 163", None, None),
+            "4 (LEB) 163": (4, "(LEB) 163", None, None),
+            "4x Lightning Bolt": None,
+            "Sideboard": None,
+            "4": None,
+        }
+        for line, expected in cases.items():
+            assert _parse_arena_line(line) == expected, line
+
+    def test_parse_crlf_and_header_case(self) -> None:
+        text = "DECK\r\n4 Lightning Bolt (LEB) 163\r\n\r\nSideboard\r\n2 Abrade (VOW) 139\r\n"
+        result = parse_arena_export(text)
+
+        assert [(c.name, c.collector_number) for c in result] == [
+            ("Lightning Bolt", "163"),
+            ("Abrade", "139"),
+        ]
+
+    def test_parse_only_splits_on_newline(self) -> None:
+        text = "4 Lightning\x0bBolt (LEB) 163\n2 Abrade\u2028Mountain"
+        result = parse_arena_export(text)
+
+        assert [(c.quantity, c.name) for c in result] == [
+            (4, "Lightning\x0bBolt"),
+            (2, "Abrade\u2028Mountain"),
+        ]
+
     def test_parse_ignores_malformed_lines(self) -> None:
         text = """4 Lightning Bolt (LEB) 163
 This is not a valid card line
@@ -97,6 +132,15 @@ Another invalid line
         assert len(result) == 1
         assert result[0].quantity == 24
 
+    def test_parse_incomplete_set_info_falls_back_to_simple(self) -> None:
+        """A set code without a collector number is kept as part of the name."""
+        text = "4 Lightning Bolt (LEB)\n2 Mountain (NEO) 290"
+        result = parse_arena_export(text)
+
+        assert [c.name for c in result] == ["Lightning Bolt (LEB)", "Mountain"]
+        assert result[0].set_code is None
+        assert result[1].set_code == "NEO"
+
     def test_parse_fixture_file(self) -> None:
         """Test parsing the fixture file."""
         fixture_path = Path(__file__).parent / "fixtures" / "sample_collection.txt"
@@ -142,6 +186,23 @@ class TestParseArenaToCollection:
         assert collection.owns("Lightning Bolt", 4)
         assert collection.owns("Mountain", 4)
 
+    def test_matches_two_step_parse(self) -> None:
+        text = """Deck
+2 Lightning Bolt (LEB) 163
+4 Lightning Bolt (M10) 146
+0 Opt (XLN) 65
+20 Mountain
+
+Sideboard
+3 Lightning Bolt"""
+        collection = parse_arena_to_collection(text)
+
+        assert collection == cards_to_collection(parse_arena_export(text))
+        assert collection.cards["Lightning Bolt"] == 4
+
+    def test_empty_input(self) -> None:
+        assert parse_arena_to_collection("  \n ").cards == {}
+
 
 class TestParseSimpleFormat:
     def test_basic_format(self) -> None:
@@ -183,6 +244,12 @@ class TestParseSimpleFormat:
         # Should be max(4, 2) = 4, not sum 4 + 2 = 6
         assert result == {"Lightning Bolt": 4}
 
+    def test_quantity_token_edge_cases(self) -> None:
+        text = "4xx Lightning Bolt\n2 x Opt\n3\tMountain\nx Forest\n5x"
+        result = parse_simple_format(text)
+
+        assert result == {"x Opt": 2, "Mountain": 3}
+
     def test_empty_input(self) -> None:
         assert parse_simple_format("") == {}
         assert parse_simple_format("   ") == {}
@@ -282,6 +349,12 @@ class TestMergeCollections:
 
         assert result == {"Lightning Bolt": 4}
 
+    def test_merge_seeds_new_cards_from_zero(self) -> None:
+        assert merge_collections({}, {"Lightning Bolt": -1}) == {"Lightning Bolt": 0}
+        assert merge_collections({"Lightning Bolt": -2}, {"Lightning Bolt": -1}) == {
+            "Lightning Bolt": -1
+        }
+
 
 class TestParseMultipleDecks:
     def test_merge_decks(self) -> None:
@@ -298,3 +371,11 @@ class TestParseMultipleDecks:
         result = parse_multiple_decks(["4 Lightning Bolt", "", "   "])
 
         assert result.get_quantity("Lightning Bolt") == 4
+
+    def test_matches_pairwise_merge(self) -> None:
+        decks = ["4 Lightning Bolt\n2 Mountain", "Card Name,Quantity\nMountain,6", "3 Opt"]
+        expected: dict[str, int] = {}
+        for text in decks:
+            expected = merge_collections(expected, parse_collection_text(text))
+
+        assert parse_multiple_decks(decks).cards == expected
@@ -1,10 +1,20 @@
 from pathlib import Path
 
+import httpx
 import pytest
+import respx
 
 from forgebreaker.scrapers.mtggoldfish import (
     DeckSummary,
+    ResponseCache,
+    _default_cache,
+    _default_client,
     _infer_archetype,
+    extract_deck_id_from_archetype,
+    fetch_archetype_page,
+    fetch_meta_decks,
+    fetch_meta_decks_async,
+    fetch_metagame_page,
     parse_deck_download,
     parse_metagame_page,
 )
@@ -73,6 +83,47 @@ class TestParseMetagamePage:
         for summary in summaries:
             assert summary.format == "historic"
 
+    def test_ignores_archetype_links_far_from_a_share(self) -> None:
+        """Links without a nearby percentage (e.g. nav menus) are skipped."""
+        html = (
+            '<a href="/archetype/nav-link">Nav Link</a>'
+            + "<p>filler</p>" * 500
+            + '<a href="/archetype/mono-red-aggro#paper">Mono Red Aggro</a>'
+            + '<span class="percentage">12.5%</span>'
+        )
+        summaries = parse_metagame_page(html, "standard")
+
+        assert [s.name for s in summaries] == ["Mono Red Aggro"]
+
+    def test_skips_non_numeric_percent_before_share(self) -> None:
+        """A URL-encoded "%2F" inside a tile does not hide the share after it."""
+        html = (
+            '<a href="/archetype/mono-red-aggro#paper">Mono Red Aggro</a>'
+            '<a href="/deck/download?name=Mono%2FRed">Download</a>'
+            '<span class="percentage">12.5%</span>'
+        )
+        summaries = parse_metagame_page(html, "standard")
+
+        assert [(s.name, s.meta_share) for s in summaries] == [("Mono Red Aggro", 0.125)]
+
+    def test_limit_stops_after_unique_decks(self, metagame_html: str) -> None:
+        """Scanning stops once limit unique decks are collected."""
+        summaries = parse_metagame_page(metagame_html, "standard", limit=2)
+
+        assert [s.name for s in summaries] == ["Mono Red Aggro", "Azorius Control"]
+        assert parse_metagame_page(metagame_html, "standard", limit=0) == []
+
+    def test_deduplicates_by_archetype_path(self) -> None:
+        """Repeated links to one archetype yield a single summary."""
+        html = (
+            '<a href="/archetype/mono-red-aggro#paper">Mono Red Aggro</a><span>12.5%</span>'
+            '<a href="/archetype/mono-red-aggro#arena">Mono-Red</a><span>12.5%</span>'
+            '<a href="/archetype/azorius-control#paper">Azorius Control</a><span>9.8%</span>'
+        )
+        summaries = parse_metagame_page(html, "standard")
+
+        assert [s.name for s in summaries] == ["Mono Red Aggro", "Azorius Control"]
+
     def test_empty_page_returns_empty_list(self) -> None:
         """Empty HTML returns empty list."""
         summaries = parse_metagame_page("<html></html>", "standard")
@@ -118,6 +169,37 @@ class TestParseDeckDownload:
         # 16 creatures + 12 instants + 20 lands = 48
         assert deck.maindeck_count() == 48
 
+    def test_handles_crlf_and_whitespace_separator(self, sample_summary: DeckSummary) -> None:
+        """CRLF line endings and whitespace-only separator lines are accepted."""
+        text = "4 Lightning Bolt\r\n20 Mountain\r\n \r\n2 Pyroblast\r\n\r\n1 Extra Card\r\n"
+        deck = parse_deck_download(text, sample_summary)
+
+        assert deck.cards == {"Lightning Bolt": 4, "Mountain": 20}
+        assert deck.sideboard == {"Pyroblast": 2}
+
+    def test_only_splits_on_newline(self, sample_summary: DeckSummary) -> None:
+        """Line-separator characters inside a card line do not split it."""
+        text = "4 Lightning\x1cBolt\n2 Shock\u2028Wave\n\n1 Opt"
+        deck = parse_deck_download(text, sample_summary)
+
+        assert deck.cards == {"Lightning\x1cBolt": 4, "Shock\u2028Wave": 2}
+        assert deck.sideboard == {"Opt": 1}
+
+    def test_no_sideboard(self, sample_summary: DeckSummary) -> None:
+        deck = parse_deck_download("4 Lightning Bolt\n4 Lightning Bolt\n", sample_summary)
+
+        assert deck.cards == {"Lightning Bolt": 8}
+        assert deck.sideboard == {}
+
+
+class TestExtractDeckId:
+    def test_first_numeric_deck_link(self) -> None:
+        html = '<a href="/deck/download">x</a><a href="/deck/7496197#paper">Deck</a>'
+        assert extract_deck_id_from_archetype(html) == "7496197"
+
+    def test_no_deck_link(self) -> None:
+        assert extract_deck_id_from_archetype('<a href="/deck/">x</a>') is None
+
 
 class TestInferArchetype:
     def test_aggro_detection(self) -> None:
@@ -142,3 +224,132 @@ class TestInferArchetype:
         assert _infer_archetype("Golgari Midrange") == "midrange"
         assert _infer_archetype("Jund") == "midrange"
         assert _infer_archetype("Some Random Deck") == "midrange"
+
+
+class TestFetchMetagamePage:
+    @respx.mock
+    def test_fetches_format_url(self) -> None:
+        route = respx.get("https://www.mtggoldfish.com/metagame/historic").mock(
+            return_value=httpx.Response(200, text="<html></html>")
+        )
+
+        assert fetch_metagame_page("historic") == "<html></html>"
+        assert route.called
+
+    def test_invalid_format_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid format"):
+            fetch_metagame_page("brawl")
+
+    def test_default_client_is_shared(self) -> None:
+        assert _default_client() is _default_client()
+
+
+class TestFetchMetaDecks:
+    @respx.mock
+    def test_fetches_decks_over_one_client(
+        self, metagame_html: str, deck_text: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base = "https://www.mtggoldfish.com"
+        respx.get(f"{base}/metagame/standard").mock(
+            return_value=httpx.Response(200, text=metagame_html)
+        )
+        respx.get(url__regex=rf"{base}/archetype/.*").mock(
+            return_value=httpx.Response(200, text='<a href="/deck/42">Deck</a>')
+        )
+        respx.get(f"{base}/deck/download/42").mock(return_value=httpx.Response(200, text=deck_text))
+        monkeypatch.setattr(httpx, "get", None)  # module-level httpx.get must not be used
+
+        decks = fetch_meta_decks("standard", limit=2)
+
+        assert [d.name for d in decks] == ["Mono Red Aggro", "Azorius Control"]
+        assert decks[0].cards["Lightning Bolt"] == 4
+
+
+class TestFetchMetaDecksAsync:
+    @respx.mock
+    async def test_matches_sync_fetch(self, metagame_html: str, deck_text: str) -> None:
+        base = "https://www.mtggoldfish.com"
+        respx.get(f"{base}/metagame/standard").mock(
+            return_value=httpx.Response(200, text=metagame_html)
+        )
+        respx.get(f"{base}/archetype/mono-red-aggro").mock(
+            return_value=httpx.Response(200, text='<a href="/deck/1">Deck</a>')
+        )
+        respx.get(f"{base}/archetype/azorius-control").mock(return_value=httpx.Response(500))
+        respx.get(f"{base}/archetype/golgari-midrange").mock(
+            return_value=httpx.Response(200, text='<a href="/deck/3">Deck</a>')
+        )
+        respx.get(url__regex=rf"{base}/deck/download/\d+").mock(
+            return_value=httpx.Response(200, text=deck_text)
+        )
+
+        decks = await fetch_meta_decks_async("standard", limit=3)
+
+        # Failed archetype is skipped; order follows the metagame page
+        assert [d.name for d in decks] == ["Mono Red Aggro", "Golgari Midrange"]
+        assert [d.name for d in decks] == [d.name for d in fetch_meta_decks("standard", limit=3)]
+
+    async def test_invalid_format_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid format"):
+            await fetch_meta_decks_async("brawl")
+
+
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        _default_cache().clear()
+
+    @respx.mock
+    def test_not_modified_reuses_cached_body(self) -> None:
+        url = "https://www.mtggoldfish.com/metagame/standard"
+        route = respx.get(url).mock(
+            side_effect=[
+                httpx.Response(200, text="<html>v1</html>", headers={"ETag": '"abc"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        assert fetch_metagame_page("standard") == "<html>v1</html>"
+        assert fetch_metagame_page("standard") == "<html>v1</html>"
+        assert route.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+    @respx.mock
+    def test_not_modified_after_eviction_refetches(self) -> None:
+        url = "https://www.mtggoldfish.com/metagame/standard"
+        route = respx.get(url).mock(
+            side_effect=[
+                httpx.Response(304),
+                httpx.Response(200, text="<html>v2</html>"),
+            ]
+        )
+
+        assert fetch_metagame_page("standard") == "<html>v2</html>"
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @respx.mock
+    def test_passed_client_is_not_cached_by_default(self) -> None:
+        url = "https://www.mtggoldfish.com/metagame/standard"
+        route = respx.get(url).mock(
+            return_value=httpx.Response(200, text="<html>v1</html>", headers={"ETag": '"abc"'})
+        )
+
+        with httpx.Client() as client:
+            fetch_metagame_page("standard", client)
+            fetch_metagame_page("standard", client)
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+        assert len(_default_cache()) == 0
+
+    @respx.mock
+    def test_cache_evicts_oldest_entry(self) -> None:
+        respx.get(url__regex=r"https://www\.mtggoldfish\.com/archetype/.*").mock(
+            return_value=httpx.Response(200, text="<html/>", headers={"ETag": '"abc"'})
+        )
+        cache = ResponseCache(max_size=1)
+
+        with httpx.Client() as client:
+            fetch_archetype_page("https://www.mtggoldfish.com/archetype/a", client, cache)
+            fetch_archetype_page("https://www.mtggoldfish.com/archetype/b", client, cache)
+
+        assert len(cache) == 1
+        assert cache.body("https://www.mtggoldfish.com/archetype/a") is None
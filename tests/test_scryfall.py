@@ -1,17 +1,31 @@
+import io
+import json
+import os
+from io import StringIO
 from pathlib import Path
 
+import httpx
 import pytest
+import respx
 
 from forgebreaker.parsers.scryfall import (
+    _ByteChunkReader,
+    _mappings_cache_path,
+    iter_json_array,
+    load_all_mappings,
     load_arena_id_mapping,
     load_card_data,
     load_rarity_mapping,
+    stream_load_mappings,
 )
 
 
 @pytest.fixture
-def sample_bulk_path() -> Path:
-    return Path(__file__).parent / "fixtures" / "scryfall_sample.json"
+def sample_bulk_path(tmp_path: Path) -> Path:
+    # Copied so mapping sidecar caches never land in tests/fixtures
+    path = tmp_path / "scryfall_sample.json"
+    path.write_bytes((Path(__file__).parent / "fixtures" / "scryfall_sample.json").read_bytes())
+    return path
 
 
 class TestLoadArenaIdMapping:
@@ -52,3 +66,177 @@ class TestLoadCardData:
 
         card = data["Card Without Arena ID"]
         assert card["arena_id"] is None
+
+
+class TestLoadAllMappings:
+    def test_matches_individual_loaders(self, sample_bulk_path: Path) -> None:
+        arena_ids, rarities, data = load_all_mappings(sample_bulk_path)
+
+        assert arena_ids == load_arena_id_mapping(sample_bulk_path)
+        assert rarities == load_rarity_mapping(sample_bulk_path)
+        assert data == load_card_data(sample_bulk_path)
+
+    def test_names_are_shared_across_mappings(self, sample_bulk_path: Path) -> None:
+        arena_ids, rarities, data = load_all_mappings(sample_bulk_path, use_cache=False)
+
+        name = data["Lightning Bolt"]["name"]
+        assert arena_ids[12345] is name
+        assert next(n for n in rarities if n == "Lightning Bolt") is name
+
+
+class TestMappingsCache:
+    def test_writes_sidecar_and_reuses_it(self, sample_bulk_path: Path) -> None:
+        first = load_all_mappings(sample_bulk_path, use_cache=True)
+        sidecar = _mappings_cache_path(sample_bulk_path)
+        assert sidecar.exists()
+
+        # Corrupt the JSON keeping mtime and size: the cache must be used
+        stat = sample_bulk_path.stat()
+        sample_bulk_path.write_text("x" * stat.st_size)
+        os.utime(sample_bulk_path, ns=(stat.st_mtime_ns, stat.st_mtime_ns))
+
+        assert load_all_mappings(sample_bulk_path, use_cache=True) == first
+
+    def test_newer_bulk_file_invalidates_sidecar(self, sample_bulk_path: Path) -> None:
+        load_all_mappings(sample_bulk_path, use_cache=True)
+        sidecar = _mappings_cache_path(sample_bulk_path)
+
+        sample_bulk_path.write_text('[{"name": "Opt", "arena_id": 1, "rarity": "common"}]')
+        newer = sidecar.stat().st_mtime_ns + 1_000_000_000
+        os.utime(sample_bulk_path, ns=(newer, newer))
+
+        arena_ids, _, _ = load_all_mappings(sample_bulk_path, use_cache=True)
+        assert arena_ids == {1: "Opt"}
+
+    def test_older_replacement_invalidates_sidecar(self, sample_bulk_path: Path) -> None:
+        load_all_mappings(sample_bulk_path, use_cache=True)
+
+        # Like cp -p of an older download: mtime moves backwards
+        sample_bulk_path.write_text('[{"name": "Opt", "arena_id": 1, "rarity": "common"}]')
+        os.utime(sample_bulk_path, ns=(1_000_000_000, 1_000_000_000))
+
+        arena_ids, _, _ = load_all_mappings(sample_bulk_path, use_cache=True)
+        assert arena_ids == {1: "Opt"}
+
+    def test_cache_is_off_by_default(self, sample_bulk_path: Path) -> None:
+        load_all_mappings(sample_bulk_path)
+
+        assert not _mappings_cache_path(sample_bulk_path).exists()
+
+    def test_corrupt_sidecar_is_ignored(self, sample_bulk_path: Path) -> None:
+        sidecar = _mappings_cache_path(sample_bulk_path)
+        sidecar.write_bytes(b"garbage")
+
+        arena_ids, _, _ = load_all_mappings(sample_bulk_path, use_cache=True)
+        assert arena_ids[12345] == "Lightning Bolt"
+
+    def test_malformed_sidecar_is_ignored(self, sample_bulk_path: Path) -> None:
+        stat = sample_bulk_path.stat()
+        sidecar = _mappings_cache_path(sample_bulk_path)
+        sidecar.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "bulk": [stat.st_mtime_ns, stat.st_size],
+                    "arena_ids": [[1]],
+                    "cards": [],
+                }
+            )
+        )
+
+        arena_ids, _, _ = load_all_mappings(sample_bulk_path, use_cache=True)
+        assert arena_ids[12345] == "Lightning Bolt"
+
+
+class TestIterJsonArray:
+    def test_streams_across_chunk_boundaries(self, sample_bulk_path: Path) -> None:
+        text = sample_bulk_path.read_text(encoding="utf-8")
+
+        streamed = list(iter_json_array(StringIO(text), chunk_size=7))
+
+        assert streamed == json.loads(text)
+
+    def test_empty_array(self) -> None:
+        assert list(iter_json_array(StringIO(" [ ] "))) == []
+
+    def test_rejects_non_array(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_json_array(StringIO('{"name": "Lightning Bolt"}')))
+
+    def test_rejects_truncated_array(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_json_array(StringIO('[{"name": "Lightning Bolt"}, {"na'), chunk_size=4))
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '[{"a": 1} {"b": 2}]',
+            '[{"a": 1},, {"b": 2}]',
+            '[, {"a": 1}]',
+            '[{"a": 1},]',
+            '[{"a": 1}] x',
+            '[{"a": 1}] ]',
+        ],
+        ids=[
+            "missing-comma",
+            "repeated-comma",
+            "leading-comma",
+            "trailing-comma",
+            "trailing-text",
+            "trailing-bracket",
+        ],
+    )
+    def test_rejects_what_json_load_rejects(self, text: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(text)
+        for chunk_size in (1, 3, 1 << 20):
+            with pytest.raises(ValueError):
+                list(iter_json_array(StringIO(text), chunk_size=chunk_size))
+
+    def test_accepts_whitespace_around_separators(self) -> None:
+        text = ' [ {"a": 1} ,\n\t{"b": 2} ] \n'
+
+        for chunk_size in (1, 3, 1 << 20):
+            assert list(iter_json_array(StringIO(text), chunk_size=chunk_size)) == json.loads(text)
+
+    def test_gives_up_on_oversized_element(self) -> None:
+        class CountingStream(StringIO):
+            consumed = 0
+
+            def read(self, size: int | None = -1) -> str:
+                chunk = super().read(size)
+                self.consumed += len(chunk)
+                return chunk
+
+        stream = CountingStream('[{"a": "' + "x" * 10_000)
+
+        with pytest.raises(ValueError, match="max_element_size"):
+            list(iter_json_array(stream, chunk_size=10, max_element_size=100))
+        assert stream.consumed < 200
+
+
+class TestStreamLoadMappings:
+    @respx.mock
+    def test_builds_mappings_from_download(self, sample_bulk_path: Path) -> None:
+        url = "https://data.scryfall.io/default-cards/default-cards.json"
+        respx.get(url).mock(return_value=httpx.Response(200, content=sample_bulk_path.read_bytes()))
+
+        assert stream_load_mappings(url) == load_all_mappings(sample_bulk_path)
+
+    @respx.mock
+    def test_raises_on_http_error(self) -> None:
+        url = "https://data.scryfall.io/default-cards/default-cards.json"
+        respx.get(url).mock(return_value=httpx.Response(500))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            stream_load_mappings(url)
+
+
+class TestByteChunkReader:
+    def test_reassembles_multibyte_text_split_across_chunks(self) -> None:
+        payload = '[{"name": "Lórien Revealed"}]'.encode()
+        chunks = iter([payload[i : i + 3] for i in range(0, len(payload), 3)])
+
+        text = io.TextIOWrapper(io.BufferedReader(_ByteChunkReader(chunks)), encoding="utf-8")
+
+        assert list(iter_json_array(text)) == [{"name": "Lórien Revealed"}]
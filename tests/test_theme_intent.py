@@ -8,6 +8,10 @@ These tests verify the invariants:
 4. Empty decks never trigger terminal success
 """
 
+import logging
+
+import pytest
+
 from forgebreaker.api.chat import _is_terminal_success
 from forgebreaker.models.collection import Collection
 from forgebreaker.models.theme_intent import (
@@ -65,6 +69,35 @@ class TestThemeNormalization:
         # The normalize_theme checks both token and singular
         assert intent.tribe is None or intent.tribe == "elf"
 
+    def test_plural_does_not_match_inside_other_words(self) -> None:
+        """Tribes only match whole tokens, not substrings ('rat' in 'pirates')."""
+        assert normalize_theme("pirates").tribe == "pirate"
+        assert normalize_theme("draft themselves").tribe is None
+
+    def test_single_word_with_case_and_padding(self) -> None:
+        """Bare tribe words match regardless of case and surrounding whitespace."""
+        assert normalize_theme("  Dragons\n").tribe == "dragon"
+        assert normalize_theme("ZOMBIE").tribe == "zombie"
+        assert normalize_theme("dragons,").tribe == "dragon"
+
+    def test_logs_normalization_when_info_enabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        """THEME_NORMALIZED records carry the extracted tribe and method."""
+        with caplog.at_level(logging.INFO, logger="forgebreaker.models.theme_intent"):
+            normalize_theme("goblins")
+            normalize_theme("burn")
+
+        records = [r for r in caplog.records if r.getMessage() == "THEME_NORMALIZED"]
+        assert [(r.extracted_tribe, r.method) for r in records] == [  # type: ignore[attr-defined]
+            ("goblin", "singular_match"),
+            (None, "no_tribe_found"),
+        ]
+
+    def test_no_log_record_when_info_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.WARNING, logger="forgebreaker.models.theme_intent"):
+            normalize_theme("goblins")
+
+        assert not caplog.records
+
     def test_unknown_theme_has_no_tribe(self) -> None:
         """Unknown theme has no tribe extracted."""
         intent = normalize_theme("burn deck")
@@ -124,6 +157,24 @@ class TestOracleSubtypeMatching:
         card_data = {"type_line": "Creature - Goblin Warrior"}
         assert card_matches_tribe("Test Goblin", card_data, "goblin")
 
+    def test_name_tokens_split_on_hyphen_apostrophe_comma(self) -> None:
+        """Hyphens, apostrophes and commas delimit name tokens."""
+        card_data = {"type_line": "Legendary Creature — Human"}
+        assert card_matches_tribe("Zombie-Bane, Lord", card_data, "zombie")
+        assert card_matches_tribe("Dragon's Herald", card_data, "dragon")
+        assert card_matches_tribe("Sliver, Queen", card_data, "sliver")
+
+    def test_only_front_face_subtypes_checked(self) -> None:
+        """Subtypes are read up to a second dash (e.g. double-faced cards)."""
+        card_data = {"type_line": "Creature — Human // Creature — Werewolf"}
+        assert card_matches_tribe("Village Watch", card_data, "human")
+        assert not card_matches_tribe("Village Watch", card_data, "werewolf")
+
+    def test_missing_type_line_falls_back_to_name(self) -> None:
+        """Cards without a type line are matched by name tokens only."""
+        assert card_matches_tribe("Goblin Token", {}, "goblin")
+        assert not card_matches_tribe("Lightning Bolt", {}, "goblin")
+
 
 class TestThemeMismatchDoesNotEmptyPool:
     """
@@ -402,3 +453,8 @@ class TestNormalizationEdgeCases:
         intent = normalize_theme("goblin elf deck")
         # Should pick the first tribe found
         assert intent.tribe in ("goblin", "elf")
+
+    def test_separators_split_tokens(self) -> None:
+        """Commas, semicolons, colons and tabs all separate tokens."""
+        assert normalize_theme("theme:zombies").tribe == "zombie"
+        assert normalize_theme("deck;\tvampire").tribe == "vampire"